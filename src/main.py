@@ -1,14 +1,27 @@
+import hashlib
 import json
 import math
+import mmap
 import os
 import random
+import re
+import sys
 import threading
 import time
 import webbrowser
+from array import array
+from collections import OrderedDict
+from functools import partial
+from weakref import WeakKeyDictionary
 
 import pygame
 import pyttsx3
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 from core.const import *
 
 pygame.init()
@@ -61,6 +74,264 @@ def get_light_texture(radius):
     return surf
 
 
+def compute_visibility_polygon(origin, radius, occluder_rects):
+    """Casts rays from `origin` at every wall corner and returns the lit polygon.
+
+    Occluders are clipped to the light's bounding square, which is also added as
+    a boundary so every ray is guaranteed to hit something.
+    """
+    ox, oy = origin
+    bounds = pygame.Rect(ox - radius, oy - radius, radius * 2, radius * 2)
+
+    segments = []
+    for rect in list(occluder_rects) + [bounds]:
+        if rect is not bounds:
+            rect = rect.clip(bounds)
+            if not rect or rect.collidepoint(origin):
+                continue
+        corners = [rect.topleft, rect.topright, rect.bottomright, rect.bottomleft]
+        for i in range(4):
+            segments.append((corners[i], corners[(i + 1) % 4]))
+
+    angles = set()
+    for start, _ in segments:
+        angle = math.atan2(start[1] - oy, start[0] - ox)
+        angles.update((angle - 0.0001, angle, angle + 0.0001))
+
+    points = []
+    for angle in sorted(angles):
+        dx, dy = math.cos(angle), math.sin(angle)
+        closest = None
+        for (x1, y1), (x2, y2) in segments:
+            sx, sy = x2 - x1, y2 - y1
+            denom = dx * sy - dy * sx
+            if abs(denom) < 1e-9:
+                continue
+            t = ((x1 - ox) * sy - (y1 - oy) * sx) / denom
+            u = ((x1 - ox) * dy - (y1 - oy) * dx) / denom
+            if t >= 0 and 0 <= u <= 1 and (closest is None or t < closest):
+                closest = t
+        if closest is not None:
+            points.append((ox + dx * closest, oy + dy * closest))
+    return points
+
+
+class SurfaceLRU:
+    """Surfaces kept in least-recently-used order under a pixel byte budget (None for no limit)."""
+
+    def __init__(self, max_bytes=None):
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self.entries = OrderedDict()
+
+    @staticmethod
+    def surface_bytes(surf):
+        return surf.get_width() * surf.get_height() * surf.get_bytesize()
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        surf = self.entries.get(key)
+        if surf is not None:
+            self.entries.move_to_end(key)
+        return surf
+
+    def put(self, key, surf):
+        self.entries[key] = surf
+        self.used_bytes += self.surface_bytes(surf)
+
+        # Evict least recently used entries, but always keep the one just added
+        while (
+                self.max_bytes is not None
+                and self.used_bytes > self.max_bytes
+                and len(self.entries) > 1
+        ):
+            _, old = self.entries.popitem(last=False)
+            self.used_bytes -= self.surface_bytes(old)
+        return surf
+
+    def get_or_build(self, key, build):
+        surf = self.get(key)
+        if surf is None:
+            surf = self.put(key, build())
+        return surf
+
+    def clear(self):
+        self.entries.clear()
+        self.used_bytes = 0
+
+
+class LightTintCache:
+    """LRU cache of light textures pre-multiplied by a quantized tint colour."""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, color_step=8):
+        self.color_step = color_step
+        self.surfaces = SurfaceLRU(max_bytes)
+
+    def quantize(self, color):
+        step = self.color_step
+        return tuple(min(255, (int(c) + step // 2) // step * step) for c in color)
+
+    def get(self, radius, color):
+        tint = self.quantize(color)
+
+        def build():
+            surf = get_light_texture(radius).copy()
+            surf.fill(tint + (255,), special_flags=pygame.BLEND_RGBA_MULT)
+            return surf
+
+        return self.surfaces.get_or_build((radius, tint), build)
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+class SpatialHash:
+    """Uniform grid of world-space rects for fast area queries."""
+
+    def __init__(self, cell_size=256):
+        self.cell_size = cell_size
+        self.cells = {}
+        self.entries = {}
+        self.next_order = 0
+
+    def _cell_range(self, rect):
+        cs = self.cell_size
+        return (
+            rect.left // cs,
+            rect.top // cs,
+            (rect.right - 1) // cs,
+            (rect.bottom - 1) // cs,
+        )
+
+    def insert(self, obj, rect):
+        if obj in self.entries:
+            self.remove(obj)
+        rect = pygame.Rect(rect)
+        x0, y0, x1, y1 = self._cell_range(rect)
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                self.cells.setdefault((cx, cy), set()).add(obj)
+        self.entries[obj] = (rect, (x0, y0, x1, y1), self.next_order)
+        self.next_order += 1
+
+    def remove(self, obj):
+        entry = self.entries.pop(obj, None)
+        if entry is None:
+            return
+        x0, y0, x1, y1 = entry[1]
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    cell.discard(obj)
+                    if not cell:
+                        del self.cells[(cx, cy)]
+
+    def update(self, obj, rect):
+        """Re-files an object only if its rect actually changed."""
+        entry = self.entries.get(obj)
+        if entry is not None and entry[0] == rect:
+            return
+        order = entry[2] if entry else None
+        self.insert(obj, rect)
+        if order is not None:
+            # Keep the original insertion order so draw order stays stable
+            new_rect, cells, _ = self.entries[obj]
+            self.entries[obj] = (new_rect, cells, order)
+
+    def query(self, rect):
+        """Returns objects whose rect overlaps `rect`, in insertion order."""
+        x0, y0, x1, y1 = self._cell_range(rect)
+        found = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cell = self.cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        entries = self.entries
+        hits = [obj for obj in found if entries[obj][0].colliderect(rect)]
+        hits.sort(key=lambda obj: entries[obj][2])
+        return hits
+
+    def clear(self):
+        self.cells.clear()
+        self.entries.clear()
+
+    def __contains__(self, obj):
+        return obj in self.entries
+
+    def __len__(self):
+        return len(self.entries)
+
+
+def swept_aabb(rect, dx, dy, other):
+    """Returns the fraction of the move (dx, dy) at which `rect` first touches `other`.
+
+    1.0 means no hit. Boxes that already overlap are ignored so movers can
+    always walk out of a wall they ended up inside.
+    """
+    if dx > 0:
+        x_entry_dist, x_exit_dist = other.left - rect.right, other.right - rect.left
+    else:
+        x_entry_dist, x_exit_dist = other.right - rect.left, other.left - rect.right
+    if dy > 0:
+        y_entry_dist, y_exit_dist = other.top - rect.bottom, other.bottom - rect.top
+    else:
+        y_entry_dist, y_exit_dist = other.bottom - rect.top, other.top - rect.bottom
+
+    if dx == 0:
+        overlapping = rect.right > other.left and rect.left < other.right
+        x_entry, x_exit = (-math.inf if overlapping else math.inf), math.inf
+    else:
+        x_entry, x_exit = x_entry_dist / dx, x_exit_dist / dx
+    if dy == 0:
+        overlapping = rect.bottom > other.top and rect.top < other.bottom
+        y_entry, y_exit = (-math.inf if overlapping else math.inf), math.inf
+    else:
+        y_entry, y_exit = y_entry_dist / dy, y_exit_dist / dy
+
+    entry, exit_ = max(x_entry, y_entry), min(x_exit, y_exit)
+    if entry > exit_ or entry < 0 or entry >= 1:
+        return 1.0
+    return entry
+
+
+def sweep_move(rect, dx, dy, collidables, skip=None):
+    """Moves `rect` in place one axis at a time, stopping at the first wall hit.
+
+    Unlike stepping and pushing back out, this cannot tunnel through thin walls
+    at any speed. Returns the entities hit on the x and y axes (or None).
+    """
+    hits = []
+    for axis_dx, axis_dy in ((dx, 0), (0, dy)):
+        if not axis_dx and not axis_dy:
+            hits.append(None)
+            continue
+
+        path = rect.union(rect.move(axis_dx, axis_dy))
+        toi, hit = 1.0, None
+        for entity in collidables.query(path):
+            if skip and skip(entity):
+                continue
+            entity_toi = swept_aabb(rect, axis_dx, axis_dy, entity.rect)
+            if entity_toi < toi:
+                toi, hit = entity_toi, entity
+
+        if hit is None:
+            rect.x += axis_dx
+            rect.y += axis_dy
+        else:
+            rect.x += round(axis_dx * toi)
+            rect.y += round(axis_dy * toi)
+        hits.append(hit)
+    return hits[0], hits[1]
+
+
 class Light:
     """Represents a single light source in the world."""
 
@@ -69,7 +340,6 @@ class Light:
         self.owner = owner
         self.radius = radius
         self.color = color
-        self.texture = get_light_texture(radius)
         self.pulse_intensity = pulse_intensity
         self.pulse_speed = pulse_speed
         self.pulse_timer = random.random() * math.pi * 2
@@ -97,18 +367,49 @@ class Light:
             if abs(diff) < 0.01:
                 self.dim_multiplier = self.target_dim_multiplier
 
+    @property
+    def texture(self):
+        return get_light_texture(self.radius)
+
+    def get_bounds(self):
+        """World-space rect covered by this light's texture."""
+        bounds = pygame.Rect(0, 0, self.radius * 2, self.radius * 2)
+        bounds.center = self.owner.rect.center
+        return bounds
+
+    def overlaps(self, rect):
+        """True if the light's circle (not just its bounding box) touches `rect`."""
+        cx, cy = self.owner.rect.center
+        nearest_x = max(rect.left, min(cx, rect.right))
+        nearest_y = max(rect.top, min(cy, rect.bottom))
+        return (cx - nearest_x) ** 2 + (cy - nearest_y) ** 2 < self.radius ** 2
+
 
 class LightingManager:
     """Manages all lights and renders the final lighting effect."""
 
-    def __init__(self, width, height, ambient_color=(20, 20, 40)):
-        self.light_surface = pygame.Surface((width, height))
+    def __init__(self, width, height, ambient_color=(20, 20, 40), cache_budget_mb=64, resolution_scale=1.0):
+        # Lighting is low-frequency, so it can be accumulated at a fraction of
+        # the screen resolution and smooth-scaled up once per frame.
+        self.resolution_scale = max(0.125, min(1.0, float(resolution_scale)))
+        self.screen_size = (width, height)
+        self.light_surface = pygame.Surface(
+            (max(1, int(width * self.resolution_scale)), max(1, int(height * self.resolution_scale)))
+        )
+        self.upscaled_surface = (
+            pygame.Surface((width, height)) if self.resolution_scale < 1.0 else None
+        )
+        self.tint_cache = LightTintCache(max_bytes=int(cache_budget_mb * 1024 * 1024))
         self.ambient_color = ambient_color
         # Add a target for smooth transitions
         self.target_ambient_color = ambient_color
         self.ambient_transition_speed = 0.015
         self.lights = []
+        self.light_index = SpatialHash(cell_size=512)
         self.occluders = []
+        self.occluder_index = SpatialHash(cell_size=256)
+        # Per-light visibility polygons, rebuilt only when the light or a nearby wall moves
+        self.shadow_cache = {}
 
     def set_ambient_light(self, new_color):
         """Sets the target ambient color for a smooth transition."""
@@ -129,9 +430,71 @@ class LightingManager:
     def add_light(self, light):
         if light not in self.lights:
             self.lights.append(light)
+            self.light_index.insert(light, light.get_bounds())
+
+    def remove_light(self, light):
+        if light in self.lights:
+            self.lights.remove(light)
+            self.light_index.remove(light)
+            self.shadow_cache.pop(light, None)
 
     def set_occluders(self, occluders):
-        self.occluders = [o.rect for o in occluders]
+        self.occluders = list(occluders)
+        self.occluder_index.clear()
+        for occluder in self.occluders:
+            self.occluder_index.insert(occluder, occluder.rect)
+        self.shadow_cache.clear()
+
+    def move_occluder(self, occluder, old_rect):
+        """Re-files a moved wall and invalidates the shadows of lights near it."""
+        self.occluder_index.update(occluder, occluder.rect)
+        for rect in (old_rect, occluder.rect):
+            for light in self.light_index.query(rect):
+                self.shadow_cache.pop(light, None)
+
+    def preload_textures(self, radii):
+        """Builds falloff textures ahead of time so spawning a light never stalls a frame."""
+        for radius in radii:
+            get_light_texture(max(1, int(radius * self.resolution_scale)))
+
+    def get_buffer_radius(self, light):
+        """The light's radius in light-buffer pixels."""
+        return max(1, int(light.radius * self.resolution_scale))
+
+    def get_shadowed_texture(self, light):
+        """Returns the light's falloff texture masked to its visibility polygon.
+
+        Returns None when no wall is in range, so the caller can use the plain texture.
+        """
+        center = light.owner.rect.center
+        entry = self.shadow_cache.get(light)
+        if entry is not None and entry["center"] == center:
+            return entry["texture"]
+
+        bounds = light.get_bounds()
+        nearby = [o.rect for o in self.occluder_index.query(bounds)]
+        if not nearby:
+            self.shadow_cache[light] = {"center": center, "texture": None}
+            return None
+
+        polygon = compute_visibility_polygon(center, light.radius, nearby)
+        base_texture = get_light_texture(self.get_buffer_radius(light))
+        texture = entry["texture"] if entry and entry["texture"] else None
+        if texture is None:
+            texture = pygame.Surface(base_texture.get_size(), pygame.SRCALPHA)
+        texture.fill((0, 0, 0, 0))
+        if len(polygon) >= 3:
+            scale = self.resolution_scale
+            local = [((x - bounds.x) * scale, (y - bounds.y) * scale) for x, y in polygon]
+            pygame.draw.polygon(texture, (255, 255, 255, 255), local)
+            texture.blit(base_texture, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+
+        self.shadow_cache[light] = {
+            "center": center,
+            "texture": texture,
+            "scratch": entry.get("scratch") if entry else None,
+        }
+        return texture
 
     def draw(self, target_surface, camera):
         # Update the ambient color and each light's state
@@ -139,9 +502,16 @@ class LightingManager:
 
         self.light_surface.fill(self.ambient_color)
 
+        # Fading and pulsing is cheap, so every light keeps ticking even off-screen
         for light in self.lights:
             light.update()  # Call the new update method on each light
             light.pulse_timer += light.pulse_speed
+            self.light_index.update(light, light.get_bounds())
+
+        view_rect = camera.get_view_rect()
+        for light in self.light_index.query(view_rect):
+            if not light.overlaps(view_rect):
+                continue
 
             pulse_multiplier = (
                     1.0 - (math.sin(light.pulse_timer) * 0.5 + 0.5) * light.pulse_intensity
@@ -155,19 +525,37 @@ class LightingManager:
                 int(light.color[2] * final_multiplier),
             )
 
-            color_surf = pygame.Surface(light.texture.get_size(), pygame.SRCALPHA)
-            color_surf.fill(current_color)
-            temp_texture = light.texture.copy()
-            temp_texture.blit(color_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            if final_multiplier <= 0:
+                continue
+
+            shadowed = self.get_shadowed_texture(light)
+            if shadowed is None:
+                temp_texture = self.tint_cache.get(self.get_buffer_radius(light), current_color)
+            else:
+                # Shadowed lights are unique, so tint into a reusable per-light buffer
+                entry = self.shadow_cache[light]
+                temp_texture = entry.get("scratch")
+                if temp_texture is None:
+                    temp_texture = pygame.Surface(shadowed.get_size(), pygame.SRCALPHA)
+                    entry["scratch"] = temp_texture
+                temp_texture.fill(current_color + (255,))
+                temp_texture.blit(shadowed, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
 
             pos = camera.apply(light.owner.rect).center
+            if self.resolution_scale < 1.0:
+                pos = (pos[0] * self.resolution_scale, pos[1] * self.resolution_scale)
             light_rect = temp_texture.get_rect(center=pos)
             self.light_surface.blit(
                 temp_texture, light_rect, special_flags=pygame.BLEND_RGBA_ADD
             )
 
+        light_map = self.light_surface
+        if self.upscaled_surface is not None:
+            pygame.transform.smoothscale(self.light_surface, self.screen_size, self.upscaled_surface)
+            light_map = self.upscaled_surface
+
         target_surface.blit(
-            self.light_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT
+            light_map, (0, 0), special_flags=pygame.BLEND_RGBA_MULT
         )
 
 
@@ -266,6 +654,9 @@ class WardenManager:
 
         if is_colliding:
             wall_to_move.rect.topleft = original_pos
+        else:
+            old_rect = pygame.Rect(original_pos, wall_to_move.rect.size)
+            self.game_scene.on_wall_moved(wall_to_move, old_rect)
 
     def trigger_backlash(self, target_name, value):
         print(f"[Warden] Backlash triggered due to hack on '{target_name}'")
@@ -410,6 +801,14 @@ class SettingsManager:
             "sfx_volume": 1.0,
             "show_map_on_start": True,
             "enable_voice_narration": True,
+            "light_cache_budget_mb": 64,
+            "lighting_resolution": 1.0,
+            "glitch_backend": "numpy",
+            "overlay_budget_mb": 48,
+            "terminal_scrollback": 1000,
+            "static_noise_frames": 8,
+            "scaled_image_budget_mb": 32,
+            "image_rleaccel": True,
         }
         self.settings = self.defaults.copy()
         self.load_settings()
@@ -438,75 +837,426 @@ class SettingsManager:
         self.save_settings()
 
 
+class MusicChannel:
+    """Streams long tracks from disk through pygame.mixer.music.
+
+    There is only one music stream, so switching tracks fades the old one out and
+    starts the next one (with its own fade in) once the fade out has finished.
+    """
+
+    def __init__(self, crossfade_ms=500):
+        self.crossfade_ms = crossfade_ms
+        self.current = None
+        self.pending = None
+        self.fade_out_until = 0
+
+    def play(self, name, path, volume, loops=0, fade_ms=0):
+        if name == self.current and pygame.mixer.music.get_busy():
+            pygame.mixer.music.set_volume(volume)
+            return
+        if pygame.mixer.music.get_busy():
+            if self.current is not None:
+                self.fadeout(self.crossfade_ms)
+            self.pending = (name, path, volume, loops, fade_ms)
+        else:
+            self.start(name, path, volume, loops, fade_ms)
+
+    def start(self, name, path, volume, loops, fade_ms):
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(loops=loops, fade_ms=fade_ms)
+            self.current = name
+        except pygame.error as e:
+            print(f"Warning: Could not stream music '{path}': {e}")
+            self.current = None
+
+    def fadeout(self, fade_ms, name=None):
+        """Fade the stream out; with a name, only if that track is the one playing or queued."""
+        if self.pending and name in (None, self.pending[0]):
+            self.pending = None
+        if name not in (None, self.current):
+            return
+        pygame.mixer.music.fadeout(fade_ms)
+        self.fade_out_until = pygame.time.get_ticks() + fade_ms
+        self.current = None
+
+    def stop(self):
+        pygame.mixer.music.stop()
+        self.current = self.pending = None
+
+    def update(self):
+        if self.pending and (
+                pygame.time.get_ticks() >= self.fade_out_until
+                or not pygame.mixer.music.get_busy()
+        ):
+            pending, self.pending = self.pending, None
+            self.start(*pending)
+
+
+ASSET_PACK_PATH = "assets/cache/assets.pack"
+ASSET_PACK_INDEX = "assets/cache/assets.index.json"
+ASSET_PACK_VERSION = 2
+
+
+def image_variant_name(name, size):
+    return f"{name}@{size[0]}x{size[1]}"
+
+
+def source_stamp(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+IMAGE_COLORKEY = (255, 0, 255)
+
+
+def classify_image_alpha(surface):
+    """Returns "opaque", "colorkey" (only fully clear or fully solid pixels) or "alpha"."""
+    area = surface.get_width() * surface.get_height()
+    solid = pygame.mask.from_surface(surface, 254)
+    if solid.count() == area:
+        return "opaque"
+    visible = pygame.mask.from_surface(surface, 0)
+    if visible.count() == solid.count():
+        return "colorkey"
+    return "alpha"
+
+
+def convert_for_blit(surface, rle=False, sparse_alpha=0.1):
+    """Converts to the display format with the cheapest blit that keeps the image intact.
+
+    Opaque art loses its alpha channel and two-level alpha becomes a colorkey.
+    With `rle`, colorkeyed sprites and those whose translucent edge pixels are
+    at most `sparse_alpha` of the image are also run-length encoded.
+    """
+    mode = classify_image_alpha(surface)
+    if mode == "opaque":
+        return surface.convert()
+
+    rle_flag = pygame.RLEACCEL if rle else 0
+    if mode == "colorkey":
+        converted = surface.convert()
+        visible = pygame.mask.from_surface(surface, 0)
+        # The key must not already be used by a visible pixel
+        key_pixels = pygame.mask.from_threshold(converted, IMAGE_COLORKEY, (1, 1, 1, 255))
+        if not key_pixels.overlap_area(visible, (0, 0)):
+            visible.invert()
+            visible.to_surface(converted, setcolor=IMAGE_COLORKEY, unsetcolor=None)
+            converted.set_colorkey(IMAGE_COLORKEY, rle_flag)
+            return converted
+
+    converted = surface.convert_alpha()
+    if rle:
+        area = surface.get_width() * surface.get_height()
+        translucent = (
+            pygame.mask.from_surface(surface, 0).count()
+            - pygame.mask.from_surface(surface, 254).count()
+        )
+        if translucent <= area * sparse_alpha:
+            converted.set_alpha(255, pygame.RLEACCEL)
+    return converted
+
+
+class AssetPack:
+    """Read-only view of the pack written by build_asset_pack.
+
+    Images are stored as raw RGBA and sound effects as PCM in the mixer's own
+    format, so loading an entry is a slice of the memory-mapped file. When a source
+    file's size or mtime differs from the build (a fresh checkout, a copy, a touch)
+    its SHA-1 decides; entries whose content really changed are decoded normally.
+    """
+
+    def __init__(self, path=ASSET_PACK_PATH, index_path=ASSET_PACK_INDEX):
+        self.entries = {}
+        self.blobs = {}
+        self.data = None
+        self.source_hashes = {}
+        self.stale_sources = set()
+        if not os.path.exists(index_path):
+            return
+        try:
+            with open(index_path, "r") as f:
+                index = json.load(f)
+            with open(path, "rb") as f:
+                self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not open asset pack '{path}': {e}")
+            return
+        if index.get("version") != ASSET_PACK_VERSION:
+            print("Warning: Asset pack is out of date, rebuild it with --build-assets.")
+            return
+        self.blobs = index["blobs"]
+        self.entries = index["entries"]
+        if index.get("mixer") != list(pygame.mixer.get_init() or ()):
+            # PCM is only usable as-is when the mixer runs in the format it was built for
+            self.entries = {
+                name: entry for name, entry in self.entries.items() if entry["kind"] != "sound"
+            }
+
+    def source_matches(self, entry, path):
+        try:
+            stamp = list(source_stamp(path))
+            if stamp == entry["stamp"]:
+                return True
+            digest = self.source_hashes.get(path)
+            if digest is None:
+                with open(path, "rb") as f:
+                    digest = self.source_hashes[path] = hashlib.sha1(f.read()).hexdigest()
+        except OSError:
+            return False
+        if digest == entry["source_hash"]:
+            entry["stamp"] = stamp
+            return True
+        if path not in self.stale_sources:
+            self.stale_sources.add(path)
+            print(f"Warning: '{path}' changed since the asset pack was built, rebuild it with --build-assets.")
+        return False
+
+    def lookup(self, name, path):
+        entry = self.entries.get(name)
+        if entry is None or entry["source"] != path:
+            return None
+        return entry if self.source_matches(entry, path) else None
+
+    def read(self, entry):
+        """The entry's bytes plus any extra blob fields (width and height for images)."""
+        offset, length, *extra = self.blobs[entry["hash"]]
+        return memoryview(self.data)[offset:offset + length], extra
+
+    def load_image(self, name, path):
+        entry = self.lookup(name, path)
+        if entry is None:
+            return None
+        data, size = self.read(entry)
+        return pygame.image.frombuffer(data, size, "RGBA")
+
+    def load_sound(self, name, path):
+        entry = self.lookup(name, path)
+        if entry is None:
+            return None
+        return pygame.mixer.Sound(buffer=self.read(entry)[0])
+
+
 class AssetManager:
-    def __init__(self):
+    def __init__(self, scaled_budget_bytes=None, rle=True):
         self.images = {}
         self.sounds = {}
+        # (name, w, h) -> surface shared by every entity drawn at that size; LRU
+        # under scaled_budget_bytes, or kept for the whole session when it is None
+        self.scaled_images = SurfaceLRU(scaled_budget_bytes)
+        self.rle = rle
+        # name -> every size the game draws that image at, set by register_image_variants
+        self.image_variants = {}
+        # (name, w, h) -> scaled surface from the preload thread, waiting for conversion
+        self.scaled_sources = {}
+        # name -> (kind, path) for every asset, in preload priority order
+        self.manifest = {}
+        # Images decoded off the main thread, waiting for convert_alpha on first use
+        self.decoded_images = {}
+        self.loading = {}
+        self.lock = threading.Lock()
+        self.preload_thread = None
+        self.music = MusicChannel()
+        self.pack = AssetPack()
         self.load_assets()
 
-    def load_image(self, name, path):
-        try:
-            self.images[name] = pygame.image.load(path).convert_alpha()
-        except pygame.error as e:
-            print(f"Warning: Could not load image '{path}': {e}")
-            self.images[name] = None
+    def register_image(self, name, path):
+        self.manifest[name] = ("image", path)
 
-    def load_sound(self, name, path):
-        try:
-            self.sounds[name] = pygame.mixer.Sound(path)
-        except pygame.error as e:
-            print(f"Warning: Could not load sound '{path}': {e}")
-            self.sounds[name] = None
+    def register_sound(self, name, path):
+        self.manifest[name] = ("sound", path)
+
+    def register_music(self, name, path):
+        """Long tracks are streamed from disk instead of being decoded into a Sound."""
+        self.manifest[name] = ("music", path)
 
     def load_assets(self):
-        self.load_image("terminal", "assets/images/terminal.png")
-        self.load_image("vignette", "assets/images/vignette.png")
-        self.load_image("cables", "assets/images/cables.png")
-        self.load_image("door_locked", "assets/images/door_locked.png")
-        self.load_image("door_unlocked", "assets/images/door_unlocked.png")
-        self.load_image("puzzle_terminal_1", "assets/images/puzzle_terminal_1.png")
-        self.load_image("puzzle_terminal_2", "assets/images/puzzle_terminal_2.png")
-        self.load_image("puzzle_terminal_3", "assets/images/puzzle_terminal_3.png")
-        self.load_image("notice", "assets/images/notice.png")
-        self.load_image("data_log", "assets/images/data_log.png")
-        self.load_image("background", "assets/images/banner.png")
-        self.load_sound("walk", "assets/audios/walk.mp3")
-        self.load_sound("whisper", "assets/audios/whisper.mp3")
-        self.load_sound("jumpscare", "assets/audios/jumpscare.mp3")
-        self.load_sound("stalker_ambience", "assets/audios/stalker_ambience.mp3")
-        self.load_sound("hum", "assets/audios/hum.mp3")
-        self.load_sound("powerup", "assets/audios/powerup.mp3")
-        self.load_sound("glitch", "assets/audios/glitch.mp3")
-        self.load_sound("interact", "assets/audios/interact.mp3")
-        self.load_sound("popup", "assets/audios/popup.mp3")
-        self.load_sound("key_press", "assets/audios/key_press.mp3")
-        self.load_sound("terminal_error", "assets/audios/terminal_error.mp3")
-        self.load_sound("override_success", "assets/audios/override_success.mp3")
-        self.load_sound("menu_music", "assets/audios/menu.mp3")
-        self.load_sound("ambient_music", "assets/audios/ambience.mp3")
-        self.load_sound("terminal_music", "assets/audios/terminal_music.mp3")
-        self.load_sound("story_line_1", "assets/audios/intro.mp3")
-        self.load_sound("story_line_8", "assets/audios/story_line_8.mp3")
-
-    def get_image(self, name):
-        return self.images.get(name)
+        # Story first, then the menu, the sector itself and the terminal; rare stingers last
+        self.register_music("story_line_1", "assets/audios/intro.mp3")
+        self.register_sound("story_line_8", "assets/audios/story_line_8.mp3")
+        self.register_image("background", "assets/images/banner.png")
+        self.register_music("menu_music", "assets/audios/menu.mp3")
+        self.register_sound("glitch", "assets/audios/glitch.mp3")
+        self.register_sound("interact", "assets/audios/interact.mp3")
+        self.register_image("vignette", "assets/images/vignette.png")
+        self.register_image("terminal", "assets/images/terminal.png")
+        self.register_image("cables", "assets/images/cables.png")
+        self.register_image("door_locked", "assets/images/door_locked.png")
+        self.register_image("door_unlocked", "assets/images/door_unlocked.png")
+        self.register_image("puzzle_terminal_1", "assets/images/puzzle_terminal_1.png")
+        self.register_image("puzzle_terminal_2", "assets/images/puzzle_terminal_2.png")
+        self.register_image("puzzle_terminal_3", "assets/images/puzzle_terminal_3.png")
+        self.register_image("notice", "assets/images/notice.png")
+        self.register_image("data_log", "assets/images/data_log.png")
+        self.register_music("ambient_music", "assets/audios/ambience.mp3")
+        self.register_sound("walk", "assets/audios/walk.mp3")
+        self.register_sound("popup", "assets/audios/popup.mp3")
+        self.register_sound("powerup", "assets/audios/powerup.mp3")
+        self.register_sound("hum", "assets/audios/hum.mp3")
+        self.register_music("terminal_music", "assets/audios/terminal_music.mp3")
+        self.register_sound("key_press", "assets/audios/key_press.mp3")
+        self.register_sound("terminal_error", "assets/audios/terminal_error.mp3")
+        self.register_sound("override_success", "assets/audios/override_success.mp3")
+        self.register_sound("whisper", "assets/audios/whisper.mp3")
+        self.register_sound("jumpscare", "assets/audios/jumpscare.mp3")
+        self.register_music("stalker_ambience", "assets/audios/stalker_ambience.mp3")
+
+    def decode(self, name):
+        """Load a manifest entry, or wait for the thread that is already loading it."""
+        with self.lock:
+            if name in self.images or name in self.sounds or name in self.decoded_images:
+                return
+            if self.manifest[name][0] == "music":
+                return
+            pending = self.loading.get(name)
+            owner = pending is None
+            if owner:
+                pending = self.loading[name] = threading.Event()
+        if not owner:
+            pending.wait()
+            return
+
+        kind, path = self.manifest[name]
+        asset = None
+        try:
+            if kind == "image":
+                asset = self.pack.load_image(name, path) or pygame.image.load(path)
+            else:
+                asset = self.pack.load_sound(name, path) or pygame.mixer.Sound(path)
+        except (pygame.error, OSError) as e:
+            print(f"Warning: Could not load {kind} '{path}': {e}")
+        finally:
+            # Always release waiters, even if the load failed
+            with self.lock:
+                if kind == "image":
+                    self.decoded_images[name] = asset
+                else:
+                    self.sounds[name] = asset
+                del self.loading[name]
+            pending.set()
+
+    def register_image_variants(self, variants):
+        """Sizes to warm instead of the full image, for images only ever drawn scaled."""
+        for name, size in variants:
+            self.image_variants.setdefault(name, []).append(tuple(size))
+
+    def preload(self):
+        for name in list(self.manifest):
+            if name in self.image_variants:
+                for size in self.image_variants[name]:
+                    self.decode_variant(name, size)
+                self.release_source_image(name)
+            else:
+                self.decode(name)
+
+    def start_preload(self):
+        """Warm every asset in priority order on a background thread."""
+        self.preload_thread = threading.Thread(target=self.preload, daemon=True)
+        self.preload_thread.start()
+
+    def get_image(self, name, size=None):
+        if size is not None:
+            return self.get_scaled_image(name, tuple(size))
+        if name not in self.images:
+            if name not in self.manifest:
+                return None
+            self.decode(name)
+            with self.lock:
+                # Conversion to the display format stays on the main thread
+                image = self.decoded_images.pop(name, None)
+                self.images[name] = convert_for_blit(image, self.rle) if image else None
+        return self.images[name]
+
+    def scale_variant(self, name, size):
+        """The image at `size` before display conversion: a pack slice, or the source scaled."""
+        image = self.pack.load_image(image_variant_name(name, size), self.manifest[name][1])
+        if image is None:
+            image = self.get_source_image(name)
+            if image is not None and image.get_size() != size:
+                image = pygame.transform.scale(image, size)
+        return image
+
+    def decode_variant(self, name, size):
+        key = (name,) + size
+        if key in self.scaled_images or key in self.scaled_sources:
+            return
+        image = self.scale_variant(name, size)
+        if image is not None:
+            with self.lock:
+                self.scaled_sources[key] = image
+
+    def release_source_image(self, name):
+        """Drop the decoded full-size image once every registered size has been built."""
+        if all(
+                (name,) + size in self.scaled_images or (name,) + size in self.scaled_sources
+                for size in self.image_variants.get(name, ())
+        ):
+            with self.lock:
+                self.decoded_images.pop(name, None)
+
+    def get_source_image(self, name):
+        """The decoded image before display conversion, for scaling into another size."""
+        if name in self.images:
+            return self.images[name]
+        self.decode(name)
+        with self.lock:
+            return self.decoded_images.get(name)
+
+    def get_scaled_image(self, name, size):
+        """Return the image at `size`, from the pack's pre-scaled copies when it has one."""
+        key = (name,) + size
+        image = self.scaled_images.get(key)
+        if image is not None:
+            return image
+        if name not in self.manifest:
+            return None
+
+        with self.lock:
+            image = self.scaled_sources.pop(key, None)
+        if image is None:
+            image = self.scale_variant(name, size)
+            if image is None:
+                return None
+        image = convert_for_blit(image, self.rle)
+        # Entities keep their own reference, so eviction only stops future sharing
+        self.scaled_images.put(key, image)
+        if name in self.image_variants:
+            self.release_source_image(name)
+        return image
+
+    def clear_scaled_images(self):
+        self.scaled_images.clear()
 
     def get_sound(self, name):
+        if name not in self.sounds and name in self.manifest:
+            self.decode(name)
         return self.sounds.get(name)
 
     def play_sound(self, name, channel="sfx", loops=0, fade_ms=0):
-        sound = self.get_sound(name)
-        if not sound:
-            return
         master_vol = settings.get("master_volume")
         if channel == "music":
             channel_vol = settings.get("music_volume")
         else:
             channel_vol = settings.get("sfx_volume")
         final_vol = master_vol * channel_vol
+
+        kind, path = self.manifest.get(name, (None, None))
+        if kind == "music":
+            self.music.play(name, path, final_vol, loops=loops, fade_ms=fade_ms)
+            return
+        sound = self.get_sound(name)
+        if not sound:
+            return
         sound.set_volume(final_vol)
         sound.play(loops=loops, fade_ms=fade_ms)
 
+    def fadeout_music(self, name, fade_ms):
+        self.music.fadeout(fade_ms, name)
+
+    def update(self):
+        self.music.update()
+
 
 class PopupManager:
     def __init__(self):
@@ -587,6 +1337,7 @@ class BaseState:
 
     def on_exit(self):
         pygame.mixer.stop()
+        assets.music.stop()
 
     def handle_events(self, events):
         pass
@@ -598,8 +1349,107 @@ class BaseState:
         pass
 
 
+class OverlayBank:
+    """Pre-rendered full-screen overlays (scanlines, static noise, vignette) kept under a byte budget."""
+
+    def __init__(self, max_bytes=48 * 1024 * 1024, static_frames=8, alpha_step=25):
+        self.alpha_step = alpha_step
+        self.surfaces = SurfaceLRU(max_bytes)
+        # Streak layouts are generated once; frames are rendered from them per size and alpha
+        self.static_patterns = [self.generate_static_pattern() for _ in range(max(1, static_frames))]
+
+    @staticmethod
+    def generate_static_pattern(count=150):
+        pattern = []
+        for _ in range(count):
+            x = random.random()
+            y = random.random()
+            w = random.randint(10, 50)
+            h = random.randint(1, 3)
+            color_val = random.randint(50, 200)
+            pattern.append((x, y, w, h, color_val, random.randint(50, 150)))
+        return pattern
+
+    def quantize(self, alpha):
+        step = self.alpha_step
+        return min(255, (int(alpha) + step // 2) // step * step)
+
+    def get(self, key, build):
+        return self.surfaces.get_or_build(key, build)
+
+    def scanlines(self, size, color, background=None, spacing=4):
+        """Horizontal lines every `spacing` rows over a transparent or solid background."""
+
+        def build():
+            if background is not None and len(background) == 3:
+                surf = pygame.Surface(size).convert()
+                surf.fill(background)
+            else:
+                surf = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+                surf.fill(background or (0, 0, 0, 0))
+            for y in range(0, size[1], spacing):
+                pygame.draw.line(surf, color, (0, y), (size[0], y))
+            if background is None:
+                # Mostly transparent, so run-length encoding skips the empty rows
+                surf.set_alpha(255, pygame.RLEACCEL)
+            return surf
+
+        return self.get(("scanlines", tuple(size), tuple(color), background, spacing), build)
+
+    def glitch_scanlines(self, size, alpha):
+        """The glitch scanline overlay with its fade alpha baked in, or None when invisible."""
+        level = self.quantize(alpha)
+        if level == 0:
+            return None
+        return self.scanlines(size, (0, 0, 0, 50 * level // 255))
+
+    def vignette_scanlines(self, vignette, alpha):
+        """The vignette composited over the glitch scanlines, so both cost a single blit."""
+        level = self.quantize(alpha)
+        if level == 0:
+            return vignette
+
+        def build():
+            surf = self.glitch_scanlines(vignette.get_size(), level).copy()
+            surf.blit(vignette, (0, 0))
+            return surf
+
+        return self.get(("vignette", vignette, level), build)
+
+    def static_frame(self, size, alpha):
+        """A random pre-rendered static noise frame at the given burst alpha."""
+        level = self.quantize(alpha)
+        index = random.randrange(len(self.static_patterns))
+
+        def build():
+            surf = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            surf.fill((0, 0, 0, 0))
+            for x, y, w, h, color_val, streak_alpha in self.static_patterns[index]:
+                color = (color_val, color_val, color_val, streak_alpha * level // 255)
+                pygame.draw.rect(surf, color, (int(x * size[0]), int(y * size[1]), w, h))
+            surf.set_alpha(255, pygame.RLEACCEL)
+            return surf
+
+        return self.get(("static", tuple(size), level, index), build)
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+def _shift_slices(height, width, dx, dy):
+    """Destination and source slices for copying a (height, width) array shifted by (dx, dy)."""
+    dest = (slice(max(dy, 0), height + min(dy, 0)), slice(max(dx, 0), width + min(dx, 0)))
+    source = (slice(max(-dy, 0), height + min(-dy, 0)), slice(max(-dx, 0), width + min(-dx, 0)))
+    return dest, source
+
+
 class GlitchManager:
-    def __init__(self):
+    def __init__(self, backend=None):
+        # "numpy" runs the distortions as array ops on the frame, "pygame" uses blits;
+        # scanlines and static come from the pre-rendered OverlayBank with either backend
+        self.backend = backend or settings.get("glitch_backend")
+        if self.backend == "numpy" and numpy is None:
+            self.backend = "pygame"
         self.glitches = []
         self.static_bursts = []
         self.active = False
@@ -643,10 +1493,54 @@ class GlitchManager:
             self.chromatic_offset_y = 0
             self.scanline_alpha = max(0, self.scanline_alpha - 5)
 
-    def draw(self, surface):
+    def draw(self, surface, scanlines=True):
         if not self.active and self.scanline_alpha == 0 and not self.static_bursts:
             return
 
+        if self.backend == "numpy" and surface.get_bytesize() == 4:
+            # Row-major (height, width, 4) byte view of the 32-bit frame, edited in place
+            pixels = pygame.surfarray.pixels2d(surface)
+            frame = pixels.T.view(numpy.uint8).reshape(surface.get_height(), surface.get_width(), 4)
+            self.draw_numpy(frame)
+            # Both views hold the surface lock, release it before the overlay blits
+            del frame, pixels
+        else:
+            self.draw_pygame(surface)
+
+        if scanlines:
+            scanline_surf = overlays.glitch_scanlines(surface.get_size(), self.scanline_alpha)
+            if scanline_surf:
+                surface.blit(scanline_surf, (0, 0))
+
+        if self.static_bursts:
+            max_alpha = max(b["alpha"] for b in self.static_bursts)
+            surface.blit(overlays.static_frame(surface.get_size(), max_alpha), (0, 0))
+
+    def draw_numpy(self, frame):
+        height, width = frame.shape[:2]
+
+        ox, oy = self.chromatic_offset_x, self.chromatic_offset_y
+        if (ox != 0 or oy != 0) and abs(ox) < width and abs(oy) < height:
+            # Same result as the ADD/SUB blit pair: image shifted by +offset minus image shifted by -offset
+            source = frame.copy()
+            frame[:] = 0
+            dest, src = _shift_slices(height, width, ox, oy)
+            frame[dest] = source[src]
+            dest, src = _shift_slices(height, width, -ox, -oy)
+            region = frame[dest]
+            region -= numpy.minimum(region, source[src])
+
+        if self.active:
+            intensity = max(g["intensity"] for g in self.glitches) if self.glitches else 0
+            for _ in range(intensity // 3):
+                slice_height = random.randint(1, 3)
+                y = random.randint(0, height - slice_height)
+                offset = random.randint(-15, 15)
+                rows = frame[y:y + slice_height].copy()
+                dest, src = _shift_slices(slice_height, width, offset, 0)
+                frame[y:y + slice_height, dest[1]] = rows[:, src[1]]
+
+    def draw_pygame(self, surface):
         if self.chromatic_offset_x != 0 or self.chromatic_offset_y != 0:
             temp_surf = surface.copy()
             surface.fill(BLACK)
@@ -677,40 +1571,188 @@ class GlitchManager:
                     except ValueError:
                         pass
 
-        if self.scanline_alpha > 0:
-            scanline_surf = pygame.Surface(
-                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-            )
-            for y in range(0, SCREEN_HEIGHT, 4):
-                pygame.draw.line(
-                    scanline_surf, (0, 0, 0, 50), (0, y), (SCREEN_WIDTH, y)
-                )
-            scanline_surf.set_alpha(self.scanline_alpha)
-            surface.blit(scanline_surf, (0, 0))
 
-        if self.static_bursts:
-            max_alpha = max(b["alpha"] for b in self.static_bursts)
-            static_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            for _ in range(150):
-                x = random.randint(0, SCREEN_WIDTH)
-                y = random.randint(0, SCREEN_HEIGHT)
-                w = random.randint(10, 50)
-                h = random.randint(1, 3)
-                color_val = random.randint(50, 200)
-                color = (color_val, color_val, color_val, random.randint(50, 150))
-                pygame.draw.rect(static_surf, color, (x, y, w, h))
-            static_surf.set_alpha(max_alpha)
-            surface.blit(static_surf, (0, 0))
+class PrefixTrie:
+    """Case-insensitive prefix tree of words that remembers each word's original spelling."""
+
+    def __init__(self, words=()):
+        # Each node maps a character to its child; the None key holds a word ending there
+        self.root = {}
+        self.size = 0
+        for word in words:
+            self.insert(word)
+
+    def find_node(self, prefix):
+        node = self.root
+        for char in prefix.lower():
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+    def insert(self, word):
+        node = self.root
+        for char in word.lower():
+            node = node.setdefault(char, {})
+        if None not in node:
+            self.size += 1
+        node[None] = word
+
+    def remove(self, word):
+        path, node = [], self.root
+        for char in word.lower():
+            if char not in node:
+                return
+            path.append((node, char))
+            node = node[char]
+        if node.pop(None, None) is None:
+            return
+        self.size -= 1
+        # Prune branches that no longer lead to any word
+        for parent, char in reversed(path):
+            if parent[char]:
+                break
+            del parent[char]
+
+    def get(self, word):
+        node = self.find_node(word)
+        return node.get(None) if node else None
+
+    def complete(self, prefix, limit=None):
+        """Words starting with prefix in alphabetical order, visiting only the matching subtree."""
+        node = self.find_node(prefix)
+        if node is None:
+            return []
+        words, stack = [], [node]
+        while stack and (limit is None or len(words) < limit):
+            node = stack.pop()
+            if None in node:
+                words.append(node[None])
+            stack.extend(node[c] for c in sorted((c for c in node if c is not None), reverse=True))
+        return words
+
+    def common_prefix(self, prefix):
+        """The longest extension of prefix shared by every matching word, or None if nothing matches."""
+        node = self.find_node(prefix)
+        if node is None:
+            return None
+        depth = len(prefix)
+        while None not in node and len(node) == 1:
+            node = next(iter(node.values()))
+            depth += 1
+        # Take the spelling from the first word below this node
+        while None not in node:
+            node = node[min(node)]
+        return node[None][:depth]
+
+    def __contains__(self, word):
+        return self.get(word) is not None
+
+    def __len__(self):
+        return self.size
+
+
+class TerminalFileIndex:
+    """Inverted index from words to the terminal file lines containing them, for grep and find."""
+
+    WORD_PATTERN = re.compile(r"\w+")
+    PLAIN_QUERY = re.compile(r"[\w\s]+")
+
+    def __init__(self, files=None):
+        self.lines = {}
+        self.postings = {}
+        self.words = PrefixTrie()
+        for name, text in (files or {}).items():
+            self.add_file(name, text)
+
+    def add_file(self, name, text):
+        self.remove_file(name)
+        self.lines[name] = text.split("\n")
+        for line_no, line in enumerate(self.lines[name]):
+            for word in set(self.WORD_PATTERN.findall(line.lower())):
+                if word not in self.postings:
+                    self.postings[word] = set()
+                    self.words.insert(word)
+                self.postings[word].add((name, line_no))
+
+    def remove_file(self, name):
+        lines = self.lines.pop(name, None)
+        if lines is None:
+            return
+        for line_no, line in enumerate(lines):
+            for word in set(self.WORD_PATTERN.findall(line.lower())):
+                hits = self.postings[word]
+                hits.discard((name, line_no))
+                if not hits:
+                    del self.postings[word]
+                    self.words.remove(word)
+
+    def lookup(self, term):
+        """Lines containing a word that starts with term."""
+        hits = set()
+        for word in self.words.complete(term):
+            hits |= self.postings[word]
+        return hits
+
+    def union(self, words):
+        hits = set()
+        for word in words:
+            hits |= self.postings[word]
+        return hits
+
+    def candidates(self, pattern):
+        """Lines that may contain a plain phrase, from the postings; None when the index can't tell.
+
+        A substring match can start inside a word and stop inside another, so the first
+        term only has to end a token, the last only has to start one, and a lone term may
+        sit anywhere inside a token. Terms in between must be whole tokens.
+        """
+        if not self.PLAIN_QUERY.fullmatch(pattern):
+            return None
+        terms = pattern.lower().split()
+        if not terms:
+            return None
+        if len(terms) == 1:
+            return self.union(word for word in self.postings if terms[0] in word)
+        hits = self.union(word for word in self.postings if word.endswith(terms[0]))
+        for term in terms[1:-1]:
+            hits &= self.postings.get(term, set())
+        return hits & self.lookup(terms[-1])
+
+    def search(self, pattern):
+        """Yield (name, line_no, line, match) for every line the case-insensitive regex matches.
+
+        Plain word queries narrow the lines down through the index first; every line is
+        still confirmed with the regex, so both paths give grep's answer.
+        Raises re.error for an invalid regex.
+        """
+        regex = re.compile(pattern, re.IGNORECASE)
+        hits = self.candidates(pattern)
+        if hits is None:
+            hits = (
+                (name, line_no)
+                for name in sorted(self.lines)
+                for line_no in range(len(self.lines[name]))
+            )
+        else:
+            hits = sorted(hits)
+        for name, line_no in hits:
+            line = self.lines[name][line_no]
+            match = regex.search(line)
+            if match:
+                yield name, line_no, line, match
 
 
 class CodeFragmentManager:
     def __init__(self):
         self.fragments = {}
         self.used_fragments = set()
+        self.fragment_trie = PrefixTrie()
 
     def collect_fragment(self, frag_id, code_string):
         if frag_id not in self.used_fragments:
             self.fragments[frag_id] = code_string
+            self.fragment_trie.insert(frag_id)
             print(f"[CodeFragments] Collected {frag_id}: {code_string}")
 
     def get_code(self, frag_id):
@@ -719,6 +1761,7 @@ class CodeFragmentManager:
     def use_fragment(self, frag_id):
         if frag_id in self.fragments:
             del self.fragments[frag_id]
+            self.fragment_trie.remove(frag_id)
             self.used_fragments.add(frag_id)
 
 
@@ -732,6 +1775,10 @@ class Camera:
     def apply(self, entity_rect):
         return entity_rect.move(self.rect.topleft)
 
+    def get_view_rect(self):
+        """The part of the world currently on screen, in world coordinates."""
+        return pygame.Rect(-self.rect.x, -self.rect.y, self.rect.width, self.rect.height)
+
     def start_shake(self, duration_ms, intensity):
         self.shake_duration = duration_ms
         self.shake_intensity = intensity
@@ -751,6 +1798,69 @@ class Camera:
         self.rect.topleft = (x, y)
 
 
+class StaticWorldLayer:
+    """Pre-rendered chunks of the walls and props that rarely change.
+
+    Chunks are rendered lazily and only re-rendered after `mark_dirty`, so the
+    per-frame cost is a handful of blits no matter how many walls a level has.
+    """
+
+    def __init__(self, chunk_size=1024):
+        self.chunk_size = chunk_size
+        self.index = SpatialHash(cell_size=256)
+        self.chunks = {}
+        self.dirty = set()
+
+    def set_entities(self, entities):
+        self.index.clear()
+        for entity in entities:
+            self.index.insert(entity, entity.rect)
+        self.chunks.clear()
+        self.dirty.clear()
+
+    def chunk_keys(self, rect):
+        cs = self.chunk_size
+        for cx in range(rect.left // cs, (rect.right - 1) // cs + 1):
+            for cy in range(rect.top // cs, (rect.bottom - 1) // cs + 1):
+                yield cx, cy
+
+    def mark_dirty(self, rect):
+        self.dirty.update(self.chunk_keys(rect))
+
+    def move_entity(self, entity, old_rect):
+        self.index.update(entity, entity.rect)
+        self.mark_dirty(old_rect)
+        self.mark_dirty(entity.rect)
+
+    def render_chunk(self, key, puzzle_manager):
+        cs = self.chunk_size
+        chunk_rect = pygame.Rect(key[0] * cs, key[1] * cs, cs, cs)
+        entities = self.index.query(chunk_rect)
+        if not entities:
+            self.chunks[key] = None
+            return
+
+        chunk_surf = pygame.Surface((cs, cs), pygame.SRCALPHA)
+        # A camera pinned to the chunk lets entities draw themselves unchanged
+        chunk_camera = Camera(cs, cs)
+        chunk_camera.rect.topleft = (-chunk_rect.x, -chunk_rect.y)
+        for entity in entities:
+            entity.draw(chunk_surf, chunk_camera, puzzle_manager)
+        # Chunks are mostly empty space, which RLE skips almost for free when blitting
+        chunk_surf.set_alpha(255, pygame.RLEACCEL)
+        self.chunks[key] = chunk_surf
+
+    def draw(self, surface, camera, puzzle_manager):
+        cs = self.chunk_size
+        for key in self.chunk_keys(camera.get_view_rect()):
+            if key in self.dirty or key not in self.chunks:
+                self.render_chunk(key, puzzle_manager)
+                self.dirty.discard(key)
+            chunk_surf = self.chunks[key]
+            if chunk_surf is not None:
+                surface.blit(chunk_surf, (key[0] * cs + camera.rect.x, key[1] * cs + camera.rect.y))
+
+
 class PuzzleManager:
     def __init__(self):
         self.state = {
@@ -778,12 +1888,17 @@ class PuzzleManager:
 
 
 class Entity(pygame.sprite.Sprite):
+    # Static entities are baked into the GameScene's StaticWorldLayer
+    is_static = True
+
     def __init__(self, x, y, w, h, name="", image=None):
         super().__init__()
         self.name = name
         self.image = image
         if image:
-            self.image = pygame.transform.scale(image, (w, h))
+            if image.get_size() != (w, h):
+                image = pygame.transform.scale(image, (w, h))
+            self.image = image
         else:
             self.image = pygame.Surface((w, h))
             self.image.fill(DARK_PURPLE)
@@ -793,28 +1908,124 @@ class Entity(pygame.sprite.Sprite):
         surface.blit(self.image, camera.apply(self.rect))
 
 
-class RainParticle:
-    """Represents a single character in the digital rain effect."""
+class DigitalRain:
+    """Persistent digital rain effect with particle state kept in flat arrays."""
 
-    def __init__(self, x, y, font):
-        self.x = x
-        self.y = y
-        self.font = font
-        self.vy = random.uniform(4, 8)
-        self.char = random.choice(["0", "1", ".", ":", ",", ";", "|", "]", "["])
-        self.surf = self.font.render(self.char, True, (0, 50, 20, 180))
+    CHARS = ["0", "1", ".", ":", ",", ";", "|", "]", "["]
+
+    def __init__(self, count, font, y_range=(-SCREEN_HEIGHT, 0)):
+        self.count = count
+        # Every glyph is rendered once; particles only reference the atlas
+        atlas = [font.render(char, True, (0, 50, 20, 180)) for char in self.CHARS]
+        self.particle_glyphs = [random.choice(atlas) for _ in range(count)]
+
+        xs = [random.randint(0, SCREEN_WIDTH) for _ in range(count)]
+        ys = [random.randint(y_range[0], y_range[1]) for _ in range(count)]
+        vys = [random.uniform(4, 8) for _ in range(count)]
+        if numpy is not None:
+            self.xs = numpy.array(xs, dtype=numpy.float32)
+            self.ys = numpy.array(ys, dtype=numpy.float32)
+            self.vys = numpy.array(vys, dtype=numpy.float32)
+        else:
+            self.xs, self.ys, self.vys = array("f", xs), array("f", ys), array("f", vys)
 
     def update(self):
-        self.y += self.vy
-        if self.y > SCREEN_HEIGHT:
-            self.y = random.randint(-100, -20)
-            self.x = random.randint(0, SCREEN_WIDTH)
+        if numpy is not None:
+            self.ys += self.vys
+            wrapped = self.ys > SCREEN_HEIGHT
+            n_wrapped = int(numpy.count_nonzero(wrapped))
+            if n_wrapped:
+                self.ys[wrapped] = numpy.random.randint(-100, -20, n_wrapped)
+                self.xs[wrapped] = numpy.random.randint(0, SCREEN_WIDTH, n_wrapped)
+            return
+
+        xs, ys, vys = self.xs, self.ys, self.vys
+        for i in range(self.count):
+            ys[i] += vys[i]
+            if ys[i] > SCREEN_HEIGHT:
+                ys[i] = random.randint(-100, -20)
+                xs[i] = random.randint(0, SCREEN_WIDTH)
 
     def draw(self, surface):
-        surface.blit(self.surf, (self.x, self.y))
+        if numpy is not None:
+            positions = zip(self.xs.tolist(), self.ys.tolist())
+        else:
+            positions = zip(self.xs, self.ys)
+        surface.blits(zip(self.particle_glyphs, positions), doreturn=False)
+
+
+class ReflectionCache:
+    """Pre-built, tinted and wave-distorted floor reflections for entity images.
+
+    Frames are keyed by the image surface itself, so an entity only pays for a
+    rebuild when it swaps to a different image.
+    """
+
+    def __init__(self, phase_count=12, wave_amplitude=2, alpha=60):
+        self.phase_count = phase_count
+        self.wave_amplitude = wave_amplitude
+        self.alpha = alpha
+        self.frames = WeakKeyDictionary()
+
+    def get_frame(self, image, ticks):
+        frames = self.frames.get(image)
+        if frames is None:
+            frames = self.build_frames(image)
+            self.frames[image] = frames
+        phase = (ticks * 0.005) % (2 * math.pi)
+        return frames[int(phase / (2 * math.pi) * self.phase_count) % self.phase_count]
+
+    def build_frames(self, image):
+        flipped = pygame.transform.flip(image, False, True)
+        if flipped.get_colorkey() is not None:
+            # The additive blend below ignores colorkeys, so turn the key into real alpha first
+            keyed, flipped = flipped, pygame.Surface(flipped.get_size(), pygame.SRCALPHA)
+            flipped.blit(keyed, (0, 0))
+        tinted = pygame.Surface(flipped.get_size(), pygame.SRCALPHA)
+        tinted.fill((10, 25, 45, 0))
+        tinted.blit(flipped, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
+        width, height = tinted.get_size()
+        frames = []
+        for i in range(self.phase_count):
+            phase = i / self.phase_count * 2 * math.pi
+            offsets = [
+                int(math.sin(x * 0.2 + phase) * self.wave_amplitude) for x in range(width)
+            ]
+            frame = pygame.Surface((width, height), pygame.SRCALPHA)
+            if numpy is not None:
+                self._shift_columns_array(tinted, frame, offsets)
+            else:
+                for x, offset in enumerate(offsets):
+                    frame.blit(tinted, (x, offset), area=pygame.Rect(x, 0, 1, height))
+            frame.set_alpha(self.alpha)
+            frames.append(frame)
+        return frames
+
+    @staticmethod
+    def _shift_columns_array(source, dest, offsets):
+        """Shifts each pixel column of `source` down by its offset, writing into `dest`."""
+        width, height = source.get_size()
+        src_rgb = pygame.surfarray.array3d(source)
+        src_alpha = pygame.surfarray.array_alpha(source)
+
+        src_y = numpy.arange(height)[None, :] - numpy.array(offsets)[:, None]
+        valid = (src_y >= 0) & (src_y < height)
+        src_y = numpy.clip(src_y, 0, height - 1)
+        columns = numpy.arange(width)[:, None]
+
+        rgb = pygame.surfarray.pixels3d(dest)
+        rgb[:] = src_rgb[columns, src_y]
+        rgb[~valid] = 0
+        del rgb
+        alpha = pygame.surfarray.pixels_alpha(dest)
+        alpha[:] = numpy.where(valid, src_alpha[columns, src_y], 0)
+        del alpha
 
 
 class WardenHunter(Entity):
+    is_static = False
+
     def __init__(self, x, y):
         size = 40
         super().__init__(x, y, size, size, name="warden_hunter")
@@ -834,7 +2045,6 @@ class WardenHunter(Entity):
 
         self.pulse_timer += 0.1
         alpha = 128 + math.sin(self.pulse_timer) * 127
-        self.image = self.base_image.copy()
         self.image.set_alpha(alpha)
 
         if now > self.move_timer:
@@ -844,31 +2054,18 @@ class WardenHunter(Entity):
         dx = self.direction[0] * self.speed
         dy = self.direction[1] * self.speed
 
-        self.rect.x += dx
-        self.check_collision("x", walls, dx)
-        self.rect.y += dy
-        self.check_collision("y", walls, dy)
+        # `walls` is a SpatialHash, so only walls along the path are tested
+        hit_x, hit_y = sweep_move(self.rect, dx, dy, walls)
+        if hit_x or hit_y:
+            self.direction = (-self.direction[0], -self.direction[1])
 
         if self.rect.colliderect(player.rect):
             player.get_caught()
 
-    def check_collision(self, direction, collidables, velocity):
-        for entity in collidables:
-            if self.rect.colliderect(entity.rect):
-                if direction == "x":
-                    if velocity > 0:
-                        self.rect.right = entity.rect.left
-                    if velocity < 0:
-                        self.rect.left = entity.rect.right
-                if direction == "y":
-                    if velocity > 0:
-                        self.rect.bottom = entity.rect.top
-                    if velocity < 0:
-                        self.rect.top = entity.rect.bottom
-                self.direction = (-self.direction[0], -self.direction[1])
-
 
 class Player(Entity):
+    is_static = False
+
     def __init__(self, x, y):
         size = 32
         super().__init__(x, y, size, size, name="player")
@@ -1010,28 +2207,11 @@ class Player(Entity):
                 sound.stop()
 
     def move(self, collidables):
-        self.rect.x += self.dx
-        self.check_collision("x", collidables)
-        self.rect.y += self.dy
-        self.check_collision("y", collidables)
-
-    def check_collision(self, direction, collidables):
-        for entity in collidables:
+        # `collidables` is a SpatialHash, so only walls along the path are tested
+        sweep_move(self.rect, self.dx, self.dy, collidables, skip=self.can_phase_through)
 
-            if self.is_lucid and isinstance(entity, Wall) and entity.phasable:
-                continue
-
-            if self.rect.colliderect(entity.rect):
-                if direction == "x":
-                    if self.dx > 0:
-                        self.rect.right = entity.rect.left
-                    if self.dx < 0:
-                        self.rect.left = entity.rect.right
-                if direction == "y":
-                    if self.dy > 0:
-                        self.rect.bottom = entity.rect.top
-                    if self.dy < 0:
-                        self.rect.top = entity.rect.bottom
+    def can_phase_through(self, entity):
+        return self.is_lucid and isinstance(entity, Wall) and entity.phasable
 
     def draw(self, surface, camera):
         surface.blit(self.image, camera.apply(self.rect))
@@ -1052,6 +2232,8 @@ class InteractiveObject(Entity):
 
 
 class CodeFragment(InteractiveObject):
+    is_static = False
+
     def __init__(self, x, y, w, h, fragment_id, code_string, image=None):
         super().__init__(x, y, w, h, "Code Fragment", image)
         self.fragment_id = fragment_id
@@ -1075,14 +2257,12 @@ class CodeFragment(InteractiveObject):
             f"Code Fragment '{self.fragment_id}' acquired.", 3
         )
 
-        if self in game_scene.interactives:
-            game_scene.interactives.remove(self)
+        game_scene.remove_interactive(self)
         assets.play_sound("powerup")
 
     def draw(self, surface, camera, puzzle_manager=None):
         self.pulse_timer += 0.05
         alpha = 155 + math.sin(self.pulse_timer) * 100
-        self.image = self.base_image.copy()
         self.image.set_alpha(alpha)
         super().draw(surface, camera, puzzle_manager)
 
@@ -1132,12 +2312,12 @@ class PuzzleTerminal(InteractiveObject):
 class Door(InteractiveObject):
     def __init__(self, x, y, w, h, image_locked=None, image_unlocked=None):
         super().__init__(x, y, w, h, name="Quarantine Door")
-        self.image_locked = (
-            pygame.transform.scale(image_locked, (w, h)) if image_locked else None
-        )
-        self.image_unlocked = (
-            pygame.transform.scale(image_unlocked, (w, h)) if image_unlocked else None
-        )
+        self.image_locked = image_locked
+        if image_locked and image_locked.get_size() != (w, h):
+            self.image_locked = pygame.transform.scale(image_locked, (w, h))
+        self.image_unlocked = image_unlocked
+        if image_unlocked and image_unlocked.get_size() != (w, h):
+            self.image_unlocked = pygame.transform.scale(image_unlocked, (w, h))
         self.image = self.image_locked
         if not self.image:
             self.image = pygame.Surface((w, h))
@@ -1483,6 +2663,7 @@ class LevelManager:
         self.state_manager.add_state("GAME", game_scene)
 
         terminal_files = level_data.get("terminal_files", {})
+        file_index = TerminalFileIndex(terminal_files)
 
         terminal_scene = TerminalState(
             self.state_manager,
@@ -1490,6 +2671,8 @@ class LevelManager:
             level_data["puzzles"],
             terminal_files,
             game_scene.code_fragment_manager,
+            level_data.get("terminal_commands", {}),
+            file_index,
         )
 
         self.state_manager.add_state("TERMINAL", terminal_scene)
@@ -1530,11 +2713,7 @@ class GameScene(BaseState):
             PopupManager(),
         )
         self.code_fragment_manager = CodeFragmentManager()
-        self.vignette_image = assets.get_image("vignette")
-        if self.vignette_image:
-            self.vignette_image = pygame.transform.scale(
-                self.vignette_image, (SCREEN_WIDTH, SCREEN_HEIGHT)
-            )
+        self.vignette_image = assets.get_image("vignette", (SCREEN_WIDTH, SCREEN_HEIGHT))
         self.warden_manager = WardenManager(self)
 
         # 0 = Off, 1 = Legacy Map, 2 = Holographic Map
@@ -1564,9 +2743,20 @@ class GameScene(BaseState):
                 self.walls.append(Wall(w_data[0], w_data[1], w_data[2], w_data[3], phasable=False))
 
         # Initialize with a dark, "power-off" ambient light
-        self.lighting_manager = LightingManager(SCREEN_WIDTH, SCREEN_HEIGHT, ambient_color=(15, 15, 25))
+        self.lighting_manager = LightingManager(
+            SCREEN_WIDTH, SCREEN_HEIGHT, ambient_color=(15, 15, 25),
+            cache_budget_mb=settings.get("light_cache_budget_mb"),
+            resolution_scale=settings.get("lighting_resolution"),
+        )
         self.lighting_manager.set_occluders(self.walls)
 
+        # Collision broadphase shared by the player and hunters
+        self.wall_index = SpatialHash(cell_size=128)
+        for wall in self.walls:
+            self.wall_index.insert(wall, wall.rect)
+        # Radii of every light this scene can create, including hunters spawned later
+        self.lighting_manager.preload_textures([250, 180, 200, 150, 300])
+
         # Player's light is always on
         player_light = Light(
             owner=self.player, radius=250, color=(70, 160, 180),
@@ -1602,7 +2792,7 @@ class GameScene(BaseState):
             new_obj = None
             if obj_type == "Terminal":
                 new_obj = Terminal(
-                    x, y, w, h, image=assets.get_image(obj_data["image_key"])
+                    x, y, w, h, image=assets.get_image(obj_data["image_key"], (w, h))
                 )
                 light = Light(
                     owner=new_obj,
@@ -1614,7 +2804,7 @@ class GameScene(BaseState):
                 self.lighting_manager.add_light(light)
             elif obj_type == "PowerCable":
                 new_obj = PowerCable(
-                    x, y, w, h, image=assets.get_image(obj_data["image_key"])
+                    x, y, w, h, image=assets.get_image(obj_data["image_key"], (w, h))
                 )
                 new_obj.light = Light(
                     owner=new_obj,
@@ -1629,8 +2819,8 @@ class GameScene(BaseState):
                     y,
                     w,
                     h,
-                    image_locked=assets.get_image(obj_data["image_locked_key"]),
-                    image_unlocked=assets.get_image(obj_data["image_unlocked_key"]),
+                    image_locked=assets.get_image(obj_data["image_locked_key"], (w, h)),
+                    image_unlocked=assets.get_image(obj_data["image_unlocked_key"], (w, h)),
                 )
             elif obj_type == "PuzzleTerminal":
                 p_info = level_data["puzzles"][obj_data["puzzle_key"]]
@@ -1643,7 +2833,7 @@ class GameScene(BaseState):
                     p_info["id"],
                     p_info["question"],
                     p_info["answer"],
-                    image=assets.get_image(obj_data["image_key"]),
+                    image=assets.get_image(obj_data["image_key"], (w, h)),
                 )
                 light = Light(
                     owner=new_obj,
@@ -1660,7 +2850,7 @@ class GameScene(BaseState):
                     w,
                     h,
                     obj_data["message"],
-                    image=assets.get_image(obj_data["image_key"]),
+                    image=assets.get_image(obj_data["image_key"], (w, h)),
                 )
             elif obj_type == "CorruptedDataLog":
                 new_obj = CorruptedDataLog(
@@ -1669,7 +2859,7 @@ class GameScene(BaseState):
                     w,
                     h,
                     obj_data["message"],
-                    image=assets.get_image(obj_data["image_key"]),
+                    image=assets.get_image(obj_data["image_key"], (w, h)),
                 )
             elif obj_type == "CodeFragment":
                 new_obj = CodeFragment(x, y, w, h, obj_data["id"], obj_data["code"])
@@ -1680,6 +2870,29 @@ class GameScene(BaseState):
             if new_obj:
                 self.interactives.append(new_obj)
 
+        self.digital_rain = DigitalRain(250, TERMINAL_FONT)
+        self.reflection_cache = ReflectionCache()
+
+        self.static_layer = StaticWorldLayer()
+        self.static_layer.set_entities(
+            self.walls + [obj for obj in self.interactives if obj.is_static]
+        )
+        # Doors draw differently once unlocked, so their chunks are redrawn on change
+        self.static_layer_door_state = self.puzzle_manager.get_state("door_unlocked")
+
+        # Exact rects of everything the player can interact with, for proximity queries
+        self.interaction_index = SpatialHash(cell_size=128)
+        for obj in self.interactives:
+            self.interaction_index.insert(obj, obj.rect)
+        self.hidden_index = SpatialHash(cell_size=128)
+        for obj in self.hidden_objects:
+            self.hidden_index.insert(obj, obj.rect)
+
+        # Everything drawn in world space, filed by the area it and its reflection cover
+        self.world_index = SpatialHash(cell_size=256)
+        for entity in self.walls + self.interactives:
+            self.world_index.insert(entity, self.get_draw_bounds(entity))
+        self.visible_entities = []
         self.flicker_timer, self.interaction_message = 0, ""
 
     def add_hunter(self):
@@ -1694,6 +2907,7 @@ class GameScene(BaseState):
 
         new_hunter = WardenHunter(spawn_x, spawn_y)
         self.hunters.append(new_hunter)
+        self.world_index.insert(new_hunter, self.get_draw_bounds(new_hunter))
         hunter_light = Light(owner=new_hunter, radius=300, color=(220, 40, 40), pulse_intensity=0.5, pulse_speed=0.1)
         self.lighting_manager.add_light(hunter_light)
 
@@ -1713,8 +2927,7 @@ class GameScene(BaseState):
         self.player.stop_sound()
         sound = assets.get_sound("hum")
         if sound: sound.stop()
-        music = assets.get_sound("ambient_music")
-        if music: music.fadeout(500)
+        assets.fadeout_music("ambient_music", 500)
 
     def handle_events(self, events):
         for event in events:
@@ -1727,23 +2940,56 @@ class GameScene(BaseState):
                 if event.key == pygame.K_LSHIFT or event.key == pygame.K_RSHIFT:
                     self.player.activate_lucid(self)
 
+    def find_nearest_interactable(self, index, reach=10):
+        """Returns the object in `index` closest to the player within `reach` pixels, or None."""
+        px, py = self.player.rect.center
+        nearest, nearest_dist = None, None
+        for obj in index.query(self.player.rect.inflate(reach * 2, reach * 2)):
+            dist = (obj.rect.centerx - px) ** 2 + (obj.rect.centery - py) ** 2
+            if nearest is None or dist < nearest_dist:
+                nearest, nearest_dist = obj, dist
+        return nearest
+
     def try_interact(self):
         # If lucid, check for hidden objects first
         if self.player.is_lucid:
-            for obj in self.hidden_objects:
-                if self.player.rect.colliderect(obj.rect.inflate(20, 20)):
-                    assets.play_sound("interact")
-                    obj.interact(self.state_manager, self.puzzle_manager)
-                    self.hidden_objects.remove(obj)  # Collect and remove
-                    return
-
-        # Check normal interactives
-        for obj in self.interactives:
-            if self.player.rect.colliderect(obj.rect.inflate(20, 20)):
+            obj = self.find_nearest_interactable(self.hidden_index)
+            if obj:
                 assets.play_sound("interact")
                 obj.interact(self.state_manager, self.puzzle_manager)
+                # Collect and remove
+                self.hidden_objects.remove(obj)
+                self.hidden_index.remove(obj)
                 return
 
+        # Check normal interactives
+        obj = self.find_nearest_interactable(self.interaction_index)
+        if obj:
+            assets.play_sound("interact")
+            obj.interact(self.state_manager, self.puzzle_manager)
+
+    @staticmethod
+    def get_draw_bounds(entity):
+        """World-space area an entity can touch when drawn, including its reflection."""
+        return pygame.Rect(entity.rect.x, entity.rect.y, entity.rect.width, entity.rect.height * 2)
+
+    def remove_interactive(self, obj):
+        if obj in self.interactives:
+            self.interactives.remove(obj)
+        self.interaction_index.remove(obj)
+        self.world_index.remove(obj)
+
+    def on_wall_moved(self, wall, old_rect):
+        """Keeps cached world state in sync after a wall is moved at runtime."""
+        self.wall_index.update(wall, wall.rect)
+        self.lighting_manager.move_occluder(wall, old_rect)
+        self.static_layer.move_entity(wall, old_rect)
+        self.world_index.update(wall, self.get_draw_bounds(wall))
+
+    def update_visible_entities(self):
+        """Culls the world to what the camera can see; every draw pass shares the result."""
+        self.visible_entities = self.world_index.query(self.camera.get_view_rect())
+
     def activate_main_power(self):
         """Called once to bring the sector lights online."""
         if self.power_has_been_restored: return  # Prevent re-running
@@ -1765,81 +3011,65 @@ class GameScene(BaseState):
         if not self.power_has_been_restored and self.puzzle_manager.get_state("power_restored"):
             self.activate_main_power()
 
-        self.player.update(self.walls, self)
+        self.player.update(self.wall_index, self)
 
         for hunter in self.hunters:
-            hunter.update(self.player, self.walls)  # Pass more args if Hunter logic needs it
+            hunter.update(self.player, self.wall_index)  # Pass more args if Hunter logic needs it
+            self.world_index.update(hunter, self.get_draw_bounds(hunter))
 
         self.camera.update(self.player)
         self.glitch_manager.update()
         self.warden_manager.update()
         self.popup_manager.update()
+        if settings.get("enable_digital_rain"):
+            self.digital_rain.update()
 
         self.corrupted_objects = [o for o in self.corrupted_objects if o["end_time"] > now]
         self.reflection_effects = [r for r in self.reflection_effects if now < r["end_time"]]
         if self.jumpscare_effect and now > self.jumpscare_effect["end_time"]:
             self.jumpscare_effect = None
 
-        prompt = ""
-        for obj in self.interactives:
-            if self.player.rect.colliderect(obj.rect.inflate(20, 20)):
-                prompt = obj.get_interaction_message(self.puzzle_manager)
-                break
-        self.interaction_message = prompt
-
-    def draw_reflections(self, surface, camera):
-        entities_to_reflect = (
-                self.walls + self.interactives + self.hunters + [self.player]
+        nearest = self.find_nearest_interactable(self.interaction_index)
+        self.interaction_message = (
+            nearest.get_interaction_message(self.puzzle_manager) if nearest else ""
         )
-        for entity in entities_to_reflect:
-            if not entity.image or entity.rect.height < 10:
-                continue
-
-            cam_rect = camera.apply(entity.rect)
-            flipped_img = pygame.transform.flip(entity.image, False, True)
-
-            reflection_surf = pygame.Surface(flipped_img.get_size(), pygame.SRCALPHA)
-            reflection_surf.fill((10, 25, 45, 0))
-            reflection_surf.blit(
-                flipped_img, (0, 0), special_flags=pygame.BLEND_RGBA_ADD
-            )
 
-            distorted_surf = pygame.Surface(flipped_img.get_size(), pygame.SRCALPHA)
-            for x in range(distorted_surf.get_width()):
-                offset = int(math.sin(x * 0.2 + pygame.time.get_ticks() * 0.005) * 2)
-                slice_rect = pygame.Rect(x, 0, 1, distorted_surf.get_height())
-                distorted_surf.blit(reflection_surf, (offset, 0), area=slice_rect)
+    def draw_reflections(self, surface, camera):
+        ticks = pygame.time.get_ticks()
+        for entity in self.visible_entities:
+            self.draw_reflection(surface, camera, entity, ticks)
+        self.draw_reflection(surface, camera, self.player, ticks)
 
-            distorted_surf.set_alpha(60)
+    def draw_reflection(self, surface, camera, entity, ticks):
+        if not entity.image or entity.rect.height < 10:
+            return
 
-            reflection_pos = (cam_rect.x, cam_rect.bottom)
-            surface.blit(distorted_surf, reflection_pos)
+        cam_rect = camera.apply(entity.rect)
+        reflection = self.reflection_cache.get_frame(entity.image, ticks)
+        surface.blit(reflection, (cam_rect.x, cam_rect.bottom))
 
     def draw(self, surface):
         self.flicker_timer = (self.flicker_timer + 1) % 60
         surface.fill(DARK_GRAY if self.flicker_timer < 50 else DARK_PURPLE)
 
-        self.rain_particles = []
         if settings.get("enable_digital_rain"):
-            self.rain_particles = [
-                RainParticle(
-                    random.randint(0, SCREEN_WIDTH),
-                    random.randint(-SCREEN_HEIGHT, 0),
-                    TERMINAL_FONT,
-                )
-                for _ in range(250)
-            ]
-
-        if self.rain_particles:
-            for p in self.rain_particles:
-                p.draw(surface)
+            self.digital_rain.draw(surface)
 
+        self.update_visible_entities()
         self.draw_reflections(surface, self.camera)
 
-        for entity in self.walls + self.interactives:
-            entity.draw(surface, self.camera, self.puzzle_manager)
-        for hunter in self.hunters:
-            hunter.draw(surface, self.camera)
+        door_state = self.puzzle_manager.get_state("door_unlocked")
+        if door_state != self.static_layer_door_state:
+            self.static_layer_door_state = door_state
+            for obj in self.interactives:
+                if isinstance(obj, Door):
+                    self.static_layer.mark_dirty(obj.rect)
+
+        self.static_layer.draw(surface, self.camera, self.puzzle_manager)
+        # Dynamic interactives were indexed before any hunter, so hunters still draw on top
+        for entity in self.visible_entities:
+            if not entity.is_static:
+                entity.draw(surface, self.camera, self.puzzle_manager)
         self.player.draw(surface, self.camera)
 
         self.lighting_manager.draw(surface, self.camera)
@@ -1852,9 +3082,12 @@ class GameScene(BaseState):
             face_surf.set_alpha(alpha)
             surface.blit(face_surf, face_surf.get_rect(center=reflection_rect.center))
 
+        screen_rect = surface.get_rect()
         for corrupted in self.corrupted_objects:
             obj = corrupted["obj"]
             cam_rect = self.camera.apply(obj.rect)
+            if not screen_rect.colliderect(cam_rect):
+                continue
             static_surf = pygame.Surface(cam_rect.size, pygame.SRCALPHA)
             for _ in range(int(cam_rect.width * cam_rect.height / 100)):
                 x = random.randint(0, cam_rect.w)
@@ -1866,10 +3099,17 @@ class GameScene(BaseState):
                 )
             surface.blit(static_surf, cam_rect.topleft)
 
-        self.glitch_manager.draw(surface)
+        # With a vignette the glitch scanlines are baked into it and drawn in one blit,
+        # unless a popup is up: the scanlines go under popups and the vignette over them
+        merge_scanlines = self.vignette_image and not self.popup_manager.popups
+        self.glitch_manager.draw(surface, scanlines=not merge_scanlines)
         self.popup_manager.draw(surface)
         if self.vignette_image:
-            surface.blit(self.vignette_image, (0, 0))
+            scanline_alpha = self.glitch_manager.scanline_alpha if merge_scanlines else 0
+            surface.blit(
+                overlays.vignette_scanlines(self.vignette_image, scanline_alpha),
+                (0, 0),
+            )
 
         if self.map_display_state == 1:
             self.draw_map_legacy(surface)
@@ -1960,8 +3200,9 @@ class GameScene(BaseState):
             2,
             border_radius=15,
         )
-        entities_to_draw = self.walls + self.interactives + self.hunters
-        for entity in entities_to_draw:
+        map_area = pygame.Rect(0, 0, map_world_radius * 2, map_world_radius * 2)
+        map_area.center = self.player.rect.center
+        for entity in self.world_index.query(map_area):
             entity_pos_world = pygame.math.Vector2(entity.rect.center)
             vec_to_entity = entity_pos_world - player_pos_world
             if vec_to_entity.length() < map_world_radius:
@@ -1987,8 +3228,13 @@ class GameScene(BaseState):
         p_center = (map_render_size / 2, map_render_size / 2)
         pygame.draw.circle(map_surf, CYAN, p_center, 6)
         pygame.draw.circle(map_surf, WHITE, p_center, 8, 2)
-        for y in range(0, map_render_size, 4):
-            pygame.draw.line(map_surf, (0, 0, 0, 100), (0, y), (map_render_size, y), 1)
+        map_surf.blit(
+            overlays.scanlines(
+                map_surf.get_size(), (0, 0, 0, 100), background=(255, 255, 255, 255)
+            ),
+            (0, 0),
+            special_flags=pygame.BLEND_RGBA_MIN,
+        )
         flicker_alpha = 190 + math.sin(pygame.time.get_ticks() * 0.01) * 50
         map_surf.set_alpha(flicker_alpha)
         surface.blit(map_surf, map_rect)
@@ -2002,6 +3248,234 @@ class GameScene(BaseState):
             pygame.draw.line(surface, (50, 100, 150, 80), player_pos_screen, corner, 2)
 
 
+class CommandRegistry:
+    """Terminal commands by name, with usage, privilege requirement and help text."""
+
+    def __init__(self):
+        self.commands = {}
+        self.names = PrefixTrie()
+
+    def register(
+            self,
+            name,
+            handler,
+            args="",
+            min_args=0,
+            privilege=0,
+            help_text="",
+            hidden=False,
+            completer=None,
+    ):
+        """completer is a PrefixTrie of values offered for Tab completion of the arguments."""
+        name = name.lower()
+        self.commands[name] = {
+            "handler": handler,
+            "usage": f"{name} {args}".strip(),
+            "min_args": min_args,
+            "privilege": privilege,
+            "help": help_text,
+            "hidden": hidden,
+            "completer": completer,
+        }
+        if hidden:
+            self.names.remove(name)
+        else:
+            self.names.insert(name)
+
+    def unregister(self, name):
+        self.commands.pop(name.lower(), None)
+        self.names.remove(name)
+
+    def get(self, name):
+        return self.commands.get(name)
+
+    def help_lines(self, privilege_level):
+        return [
+            f"  {spec['usage']:<16} // {spec['help']}"
+            for spec in self.commands.values()
+            if not spec["hidden"] and spec["privilege"] <= privilege_level
+        ]
+
+    def __contains__(self, name):
+        return name in self.commands
+
+    def __iter__(self):
+        return iter(self.commands)
+
+
+class ScrollbackBuffer:
+    """Fixed-capacity ring buffer of terminal lines; the oldest lines are dropped when full."""
+
+    def __init__(self, capacity=1000):
+        self.capacity = max(1, capacity)
+        self.lines = [None] * self.capacity
+        self.start = 0
+        self.count = 0
+
+    def append(self, line):
+        self.lines[(self.start + self.count) % self.capacity] = line
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def extend(self, lines):
+        for line in lines:
+            self.append(line)
+
+    def clear(self):
+        self.lines = [None] * self.capacity
+        self.start = self.count = 0
+
+    def window(self, first, size):
+        """Lines first .. first + size - 1, counted from the oldest retained line."""
+        first = max(0, first)
+        last = min(self.count, first + size)
+        return [self.lines[(self.start + i) % self.capacity] for i in range(first, last)]
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.window(0, self.count))
+
+
+class TextPager:
+    """Lazily word-wrapped view of a long text, paged like less."""
+
+    def __init__(self, name, text, wrap, page_lines):
+        self.name = name
+        self.paragraphs = text.split("\n")
+        self.wrap = wrap
+        self.page_lines = page_lines
+        self.lines = []
+        # First wrapped line of every paragraph wrapped so far
+        self.paragraph_starts = []
+        self.top = 0
+        self.last_search = ""
+        # Jumps that need more of the text wrapped are finished by wrap_for over later frames
+        self.pending_search, self.pending_end = None, False
+
+    @property
+    def complete(self):
+        return len(self.paragraph_starts) == len(self.paragraphs)
+
+    def wrap_next(self):
+        self.paragraph_starts.append(len(self.lines))
+        self.lines.extend(self.wrap(self.paragraphs[len(self.paragraph_starts) - 1]))
+
+    def ensure_lines(self, count):
+        while len(self.lines) < count and not self.complete:
+            self.wrap_next()
+
+    def page(self):
+        self.ensure_lines(self.top + self.page_lines)
+        return self.lines[self.top:self.top + self.page_lines]
+
+    def at_end(self):
+        self.ensure_lines(self.top + self.page_lines + 1)
+        return self.top + self.page_lines >= len(self.lines)
+
+    def scroll(self, lines):
+        self.top = max(0, self.top + lines)
+        self.ensure_lines(self.top + self.page_lines)
+        self.top = min(self.top, max(0, len(self.lines) - self.page_lines))
+
+    @property
+    def pending(self):
+        return self.pending_search is not None or self.pending_end
+
+    def scroll_to_end(self):
+        self.pending_search, self.pending_end = None, True
+        self.wrap_for(0)
+
+    def search(self, term):
+        """Move the next line containing term to the top of the page; False if there is none."""
+        term = term.lower()
+        self.pending_search, self.pending_end = None, False
+        for index in range(self.top + 1, len(self.lines)):
+            if term in self.lines[index].lower():
+                self.top = index
+                return True
+        # Paragraphs not wrapped yet are searched as raw text; the jump waits for the wrap
+        for index in range(len(self.paragraph_starts), len(self.paragraphs)):
+            if term in self.paragraphs[index].lower():
+                self.pending_search = (index, term)
+                self.wrap_for(0)
+                return True
+        return False
+
+    def wrap_for(self, seconds):
+        """Wrap paragraphs for about the given time, then finish any pending jump that is ready."""
+        deadline = time.perf_counter() + seconds
+        while not self.complete:
+            if self.pending_search and len(self.paragraph_starts) > self.pending_search[0]:
+                break
+            if time.perf_counter() >= deadline:
+                break
+            self.wrap_next()
+
+        if self.pending_search and len(self.paragraph_starts) > self.pending_search[0]:
+            index, term = self.pending_search
+            start = self.paragraph_starts[index]
+            end = (
+                self.paragraph_starts[index + 1]
+                if index + 1 < len(self.paragraph_starts)
+                else len(self.lines)
+            )
+            self.top = next((i for i in range(start, end) if term in self.lines[i].lower()), start)
+            self.pending_search = None
+        elif self.pending_end and self.complete:
+            self.top = max(0, len(self.lines) - self.page_lines)
+            self.pending_end = False
+
+    def status(self):
+        if self.pending:
+            return f"-- {self.name}  searching... ({len(self.paragraph_starts)}/{len(self.paragraphs)} paragraphs)"
+        last = min(self.top + self.page_lines, len(self.lines))
+        total = f"/{len(self.lines)}" if self.complete else ""
+        end = "  (END)" if self.at_end() else ""
+        return f"-- {self.name}  lines {self.top + 1}-{last}{total}{end}  [space] next  [b] back  [/] search  [q] quit"
+
+
+class GlowTextCache:
+    """LRU cache of text lines rendered together with their glow into a single surface."""
+
+    def __init__(self, font, max_entries=256):
+        self.font = font
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+
+    def render(self, text, color):
+        text_surf = self.font.render(text, True, color)
+        blur_surf = self.font.render(text, True, tuple(c * 0.5 for c in color))
+        blur_surf.set_alpha(100)
+        # One pixel of padding on every side for the offset glow copies
+        surf = pygame.Surface(
+            (text_surf.get_width() + 2, text_surf.get_height() + 2), pygame.SRCALPHA
+        )
+        surf.blit(blur_surf, (2, 2))
+        surf.blit(blur_surf, (0, 0))
+        surf.blit(text_surf, (1, 1))
+        return surf
+
+    def get(self, text, color):
+        key = (text, tuple(color))
+        surf = self.entries.get(key)
+        if surf is not None:
+            self.entries.move_to_end(key)
+            return surf
+
+        surf = self.render(text, color)
+        self.entries[key] = surf
+        if len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self.entries.clear()
+
+
 class TerminalState(BaseState):
     def __init__(
             self,
@@ -2010,6 +3484,8 @@ class TerminalState(BaseState):
             puzzles_data,
             terminal_files,
             code_fragment_manager,
+            terminal_commands=None,
+            file_index=None,
     ):
         super().__init__()
         self.state_manager, self.puzzle_manager, self.puzzles, self.files = (
@@ -2021,23 +3497,41 @@ class TerminalState(BaseState):
         self.code_fragment_manager = code_fragment_manager
         self.input_text, self.output_lines, self.command_history, self.history_index = (
             "",
-            [],
+            ScrollbackBuffer(settings.get("terminal_scrollback")),
             [],
             -1,
         )
+        self.scroll_offset = 0
         self.cursor_visible, self.cursor_timer = True, 0
         self.typewriter_effect = {"text": "", "pos": 0, "lines": [], "start_time": 0}
         self.transition_alpha, self.transition_state = 255, "in"
         self.current_prompt = ""
+        self.line_height = TERMINAL_FONT.get_height() + 5
+        self.visible_lines = (SCREEN_HEIGHT - 60) // self.line_height
+        self.file_trie = PrefixTrie(self.files)
+        self.file_index = file_index or TerminalFileIndex(self.files)
+        # Long results are fed into scrollback a few lines per frame
+        self.output_stream, self.stream_lines_per_frame = None, 8
+        # Pagers keep their wrapped lines, so they are cached per file and wrap width
+        self.pagers, self.pager, self.pager_search, self.pager_message = {}, None, None, ""
+        self.word_widths = {}
+        self.commands = CommandRegistry()
+        self.register_builtin_commands()
+        self.register_level_commands(terminal_commands or {})
+        self.glow_cache = GlowTextCache(TERMINAL_FONT)
+        self.prompt_text, self.prompt_surface, self.prompt_width = None, None, 0
+        self.fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.fade_surface.fill(BLACK)
 
     def on_enter(self):
         self.transition_alpha, self.transition_state = 255, "in"
         self.input_text, self.output_lines, self.command_history, self.history_index = (
             "",
-            [],
+            ScrollbackBuffer(settings.get("terminal_scrollback")),
             [],
             -1,
         )
+        self.scroll_offset, self.output_stream, self.pager = 0, None, None
         assets.play_sound("terminal_music", channel="music", loops=-1, fade_ms=500)
 
         self.update_prompt()
@@ -2060,9 +3554,7 @@ class TerminalState(BaseState):
         self.add_output_multiline(boot_sequence)
 
     def on_exit(self):
-        music = assets.get_sound("terminal_music")
-        if music:
-            music.fadeout(500)
+        assets.fadeout_music("terminal_music", 500)
 
     def update_prompt(self):
         priv_level = self.puzzle_manager.get_state("privilege_level")
@@ -2075,14 +3567,30 @@ class TerminalState(BaseState):
         elif priv_level >= 3:
             self.current_prompt = "Aris.Thorne@Mindfall:# "
 
+    def _word_width(self, word, font):
+        width = self.word_widths.get((font, word))
+        if width is None:
+            width = self.word_widths[(font, word)] = font.size(word)[0]
+        return width
+
     def _wrap_text(self, text, font, max_width):
-        words, lines, current_line = text.split(" "), [], ""
+        # Sum cached word widths and only measure the whole line near the wrap point.
+        # Each measured piece can be a pixel short, so allow two pixels per word of slack.
+        space = self._word_width(" ", font)
+        words, lines, current_line, current_width, slack = text.split(" "), [], "", 0, 2
         for word in words:
-            if font.size(current_line + word)[0] <= max_width:
+            word_width = self._word_width(word, font)
+            if current_width + word_width + slack <= max_width:
+                fits = True
+            else:
+                fits = font.size(current_line + word)[0] <= max_width
+            if fits:
                 current_line += word + " "
+                current_width += word_width + space
+                slack += 2
             else:
                 lines.append(current_line.strip())
-                current_line = word + " "
+                current_line, current_width, slack = word + " ", word_width + space, 4
         lines.append(current_line.strip())
         return lines
 
@@ -2110,6 +3618,10 @@ class TerminalState(BaseState):
             "start_time": time.time(),
         }
 
+    def scroll(self, lines):
+        max_offset = max(0, len(self.output_lines) - self.visible_lines)
+        self.scroll_offset = max(0, min(max_offset, self.scroll_offset + lines))
+
     def handle_events(self, events):
         if self.transition_state != "active":
             return
@@ -2117,10 +3629,26 @@ class TerminalState(BaseState):
             if any(e.type == pygame.KEYDOWN for e in events):
                 self.finish_typewriter()
             return
+        if self.output_stream is not None:
+            if any(e.type == pygame.KEYDOWN for e in events):
+                self.output_stream = None
+                self.add_output("^C", instant=True)
+            return
+        if self.pager is not None:
+            self.handle_pager_events(events)
+            return
         for event in events:
+            if event.type == pygame.MOUSEWHEEL:
+                self.scroll(event.y * 3)
             if event.type == pygame.KEYDOWN:
                 assets.play_sound("key_press")
-                if event.key == pygame.K_RETURN:
+                if event.key == pygame.K_PAGEUP:
+                    self.scroll(self.visible_lines - 1)
+                elif event.key == pygame.K_PAGEDOWN:
+                    self.scroll(-(self.visible_lines - 1))
+                elif event.key == pygame.K_TAB:
+                    self.complete_input()
+                elif event.key == pygame.K_RETURN:
                     if self.input_text.strip():
                         self.command_history.insert(0, self.input_text)
                         self.history_index = -1
@@ -2143,133 +3671,344 @@ class TerminalState(BaseState):
                 else:
                     self.input_text += event.unicode
 
+    def register_builtin_commands(self):
+        self.commands.register("help", self.command_help, hidden=True)
+        self.commands.register(
+            "status",
+            self.command_status,
+            help_text="Check system integrity and protocol status.",
+        )
+        self.commands.register(
+            "unlock",
+            self.command_unlock,
+            help_text="[REQUIRES 3 KEYS] Unlock passage to next sector.",
+        )
+        self.commands.register(
+            "integrate",
+            self.command_integrate,
+            args="<code>",
+            min_args=1,
+            help_text="Input re-integrated memory code.",
+        )
+        self.commands.register(
+            "exec",
+            self.command_exec,
+            args="<frag_id>",
+            min_args=1,
+            privilege=2,
+            help_text="Execute a collected code fragment.",
+            completer=self.code_fragment_manager.fragment_trie,
+        )
+        self.commands.register(
+            "ls", self.command_ls, help_text="List accessible data fragments."
+        )
+        self.commands.register(
+            "cat",
+            self.command_cat,
+            args="<fragment>",
+            min_args=1,
+            help_text="Read a data fragment.",
+            completer=self.file_trie,
+        )
+        self.commands.register(
+            "grep",
+            self.command_grep,
+            args="<pattern>",
+            min_args=1,
+            help_text="Search data fragments for words or a regex.",
+        )
+        self.commands.register(
+            "find",
+            self.command_find,
+            args="<term>",
+            min_args=1,
+            help_text="List data fragments mentioning a term.",
+        )
+        self.commands.register("clear", self.command_clear, help_text="Clear the screen.")
+        self.commands.register(
+            "exit", self.command_exit, help_text="Disconnect from terminal."
+        )
+
+    def register_level_commands(self, terminal_commands):
+        """Register a level's "terminal_commands": either a "handler(terminal, args)" callable
+        or a scripted command using "output", "speak", "sound" and "set_state".
+        An optional "completions" list is offered for Tab completion of its arguments."""
+        for name, spec in terminal_commands.items():
+            if "handler" in spec:
+                handler = partial(spec["handler"], self)
+            else:
+                handler = partial(self.run_level_command, spec)
+            self.commands.register(
+                name,
+                handler,
+                args=spec.get("args", ""),
+                min_args=spec.get("min_args", 0),
+                privilege=spec.get("privilege", 0),
+                help_text=spec.get("help", ""),
+                hidden=spec.get("hidden", False),
+                completer=PrefixTrie(spec.get("completions", ())),
+            )
+
+    def run_level_command(self, spec, args):
+        for key, value in spec.get("set_state", {}).items():
+            self.puzzle_manager.set_state(key, value)
+        if "output" in spec:
+            self.add_output(spec["output"], instant=spec.get("instant", False))
+        if "speak" in spec:
+            voice_manager.speak(spec["speak"])
+        if "sound" in spec:
+            assets.play_sound(spec["sound"])
+
+    def add_file(self, name, text):
+        self.remove_file(name)
+        self.files[name] = text
+        self.file_trie.insert(name)
+        self.file_index.add_file(name, text)
+
+    def remove_file(self, name):
+        self.files.pop(name, None)
+        self.file_trie.remove(name)
+        self.file_index.remove_file(name)
+        self.pagers = {key: pager for key, pager in self.pagers.items() if key[0] != name}
+
+    def stream_output(self, lines):
+        self.output_stream = iter(lines)
+
+    def complete_input(self):
+        words = self.input_text.split(" ")
+        prefix = words[-1]
+        if len(words) == 1:
+            trie = self.commands.names
+        else:
+            spec = self.commands.get(words[0].lower())
+            trie = spec["completer"] if spec else None
+        if trie is None:
+            return
+
+        matches = trie.complete(prefix, limit=2)
+        if len(matches) == 1:
+            words[-1] = matches[0] + " "
+        elif matches:
+            completion = trie.common_prefix(prefix)
+            if len(completion) > len(prefix):
+                words[-1] = completion
+            else:
+                # Nothing more to fill in, show the candidates instead
+                self.add_output("  ".join(trie.complete(prefix, limit=40)), instant=True)
+        self.input_text = " ".join(words)
+
     def process_command(self):
         full_command, self.input_text = self.input_text.lower().strip(), ""
+        self.scroll_offset = 0
 
         self.add_output(f"{self.current_prompt}{full_command}", instant=True)
         parts = full_command.split()
-        command = parts[0] if parts else ""
-        if not command:
+        if not parts:
             return
-        if command == "help":
-
+        command, args = parts[0], parts[1:]
+        spec = self.commands.get(command)
+        if spec is None:
+            self.add_output(f"Command not recognized: '{command}'.")
+            assets.play_sound("terminal_error")
+            return
+        if self.puzzle_manager.get_state("privilege_level") < spec["privilege"]:
             self.add_output(
-                "Available Commands:\n"
-                "  status           // Check system integrity and protocol status.\n"
-                "  unlock           // [REQUIRES 3 KEYS] Unlock passage to next sector.\n"
-                "  integrate <code> // Input re-integrated memory code.\n"
-                "  ls               // List accessible data fragments.\n"
-                "  cat <fragment>   // Read a data fragment.\n"
-                "  clear            // Clear the screen.\n"
-                "  exit             // Disconnect from terminal.",
-                instant=True,
+                f"ERROR: Command requires privilege level {spec['privilege']} or higher."
             )
+            assets.play_sound("terminal_error")
+            return
+        if len(args) < spec["min_args"]:
+            self.add_output(f"Usage: {spec['usage']}")
+            assets.play_sound("terminal_error")
+            return
+        spec["handler"](args)
 
-        elif command == "exec":
-            priv_level = self.puzzle_manager.get_state("privilege_level")
-            if priv_level < 2:
-                self.add_output("ERROR: Command requires privilege level 2 or higher.")
-                assets.play_sound("terminal_error")
-                return
-            if len(parts) > 1:
-                frag_id = parts[1]
-                code = self.code_fragment_manager.get_code(frag_id)
-                if code:
-                    self.execute_code(frag_id, code)
-                else:
-                    self.add_output(
-                        f"ERROR: Code Fragment '{frag_id}' not found or already used."
-                    )
-                    assets.play_sound("terminal_error")
-            else:
-                self.add_output("Usage: exec <fragment_id>")
-
-        elif command == "status":
-            priv = self.puzzle_manager.get_state("privilege_level")
-            door = (
-                "UNLOCKED"
-                if self.puzzle_manager.get_state("door_unlocked")
-                else "LOCKED"
-            )
-            protocol_status = (
-                "Awaiting full integration" if priv < 3 else "Ready for initiation"
-            )
-            voice_manager.speak(
-                f"Fragmentation Keys: {priv} of 3. Sector Lock: {door}. Protocol Damnatio Memoriae: {protocol_status}"
+    def command_help(self, args):
+        priv_level = self.puzzle_manager.get_state("privilege_level")
+        self.add_output(
+            "\n".join(["Available Commands:"] + self.commands.help_lines(priv_level)),
+            instant=True,
+        )
+
+    def command_exec(self, args):
+        frag_id = self.code_fragment_manager.fragment_trie.get(args[0]) or args[0]
+        code = self.code_fragment_manager.get_code(frag_id)
+        if code:
+            self.execute_code(frag_id, code)
+        else:
+            self.add_output(f"ERROR: Code Fragment '{frag_id}' not found or already used.")
+            assets.play_sound("terminal_error")
+
+    def command_status(self, args):
+        priv = self.puzzle_manager.get_state("privilege_level")
+        door = "UNLOCKED" if self.puzzle_manager.get_state("door_unlocked") else "LOCKED"
+        protocol_status = (
+            "Awaiting full integration" if priv < 3 else "Ready for initiation"
+        )
+        voice_manager.speak(
+            f"Fragmentation Keys: {priv} of 3. Sector Lock: {door}. Protocol Damnatio Memoriae: {protocol_status}"
+        )
+        self.add_output(
+            f"Fragmentation Keys: {priv}/3\nSector Lock: {door}\nProtocol Damnatio Memoriae: {protocol_status}"
+        )
+
+    def command_clear(self, args):
+        self.output_lines.clear()
+        self.scroll_offset = 0
+
+    def command_unlock(self, args):
+        if self.puzzle_manager.get_state("privilege_level") >= 3:
+            self.add_output(
+                "All Fragmentation Keys accepted. Quarantine lock for this sector disengaged..."
             )
+            voice_manager.speak("Access granted. You may proceed.")
+            self.puzzle_manager.set_state("door_unlocked", True)
+            assets.play_sound("override_success")
+        else:
             self.add_output(
-                f"Fragmentation Keys: {priv}/3\nSector Lock: {door}\nProtocol Damnatio Memoriae: {protocol_status}"
+                "ERROR: Insufficient Fragmentation Keys. Full re-integration required."
             )
+            voice_manager.speak("ERROR: You are not whole. You cannot proceed.")
+            assets.play_sound("terminal_error")
 
-        elif command == "clear":
-            self.output_lines = []
-        elif command == "unlock":
-            if self.puzzle_manager.get_state("privilege_level") >= 3:
-                self.add_output(
-                    "All Fragmentation Keys accepted. Quarantine lock for this sector disengaged..."
-                )
-                voice_manager.speak("Access granted. You may proceed.")
-                self.puzzle_manager.set_state("door_unlocked", True)
-                assets.play_sound("override_success")
-            else:
-                self.add_output(
-                    "ERROR: Insufficient Fragmentation Keys. Full re-integration required."
-                )
-                voice_manager.speak("ERROR: You are not whole. You cannot proceed.")
-                assets.play_sound("terminal_error")
+    def command_integrate(self, args):
+        code = args[0]
+        for puzzle in self.puzzles.values():
+            if code == puzzle["answer"]:
+                if not self.puzzle_manager.get_state(f"{puzzle['id']}_solved"):
+                    self.puzzle_manager.set_state(f"{puzzle['id']}_solved", True)
+                    self.puzzle_manager.increment_privilege()
+                    self.add_output(
+                        "Memory fragment accepted. Consciousness re-integrating...\nFragmentation Key acquired."
+                    )
+                    voice_manager.speak(
+                        "Memory fragment accepted. You are one step closer to the end."
+                    )
+                    assets.play_sound("override_success")
+                    self.update_prompt()
+                else:
+                    self.add_output("Memory fragment already integrated. No effect.")
+                return
+        self.add_output("ERROR: Invalid memory code.")
+        assets.play_sound("terminal_error")
 
-        elif command == "integrate":
-            if len(parts) > 1:
-                code, found = parts[1], False
-                for puzzle in self.puzzles.values():
-                    if code == puzzle["answer"]:
-                        found = True
-                        if not self.puzzle_manager.get_state(f"{puzzle['id']}_solved"):
-                            self.puzzle_manager.set_state(
-                                f"{puzzle['id']}_solved", True
-                            )
-                            self.puzzle_manager.increment_privilege()
-                            self.add_output(
-                                "Memory fragment accepted. Consciousness re-integrating...\nFragmentation Key acquired."
-                            )
-                            voice_manager.speak(
-                                "Memory fragment accepted. You are one step closer to the end."
-                            )
-                            assets.play_sound("override_success")
-                            self.update_prompt()
-                        else:
-                            self.add_output(
-                                "Memory fragment already integrated. No effect."
-                            )
-                        break
-                if not found:
-                    self.add_output("ERROR: Invalid memory code.")
-                    assets.play_sound("terminal_error")
-            else:
-                self.add_output("Usage: integrate <memory_code>")
-                assets.play_sound("terminal_error")
-        elif command == "ls":
-            self.add_output(
-                " ".join(self.files.keys())
-                if self.files
-                else "No data fragments found."
+    def command_ls(self, args):
+        self.add_output(
+            " ".join(self.files.keys()) if self.files else "No data fragments found."
+        )
+
+    def command_cat(self, args):
+        # Input is lowercased, so file names are resolved case-insensitively
+        filename = self.file_trie.get(args[0])
+        if filename not in self.files:
+            self.add_output(f"ERROR: Fragment not found: '{args[0]}'")
+            assets.play_sound("terminal_error")
+            return
+
+        width = SCREEN_WIDTH - 40
+        pager = self.pagers.get((filename, width))
+        if pager is None:
+            pager = TextPager(
+                filename,
+                self.files[filename],
+                lambda text: self._wrap_text(text, TERMINAL_FONT, width),
+                self.visible_lines - 1,
             )
-        elif command == "cat":
-            if len(parts) > 1:
-                filename = parts[1]
-                if filename in self.files:
-                    self.add_output(self.files[filename], instant=True)
-                else:
-                    self.add_output(f"ERROR: Fragment not found: '{filename}'")
-                    assets.play_sound("terminal_error")
-            else:
-                self.add_output("Usage: cat <fragment>")
-                assets.play_sound("terminal_error")
-        elif command == "exit":
-            self.transition_state = "out"
+            self.pagers[(filename, width)] = pager
+        pager.top = 0
+
+        # Only wrap one page up front; short fragments still go straight to scrollback
+        pager.ensure_lines(pager.page_lines + 1)
+        if pager.complete and len(pager.lines) <= pager.page_lines:
+            self.output_lines.extend(pager.lines)
         else:
-            self.add_output(f"Command not recognized: '{command}'.")
+            self.pager, self.pager_search, self.pager_message = pager, None, ""
+
+    def handle_pager_events(self, events):
+        pager = self.pager
+        for event in events:
+            if event.type == pygame.MOUSEWHEEL:
+                pager.scroll(-event.y * 3)
+            if event.type != pygame.KEYDOWN:
+                continue
+            self.pager_message = ""
+            if self.pager_search is not None:
+                if event.key == pygame.K_RETURN:
+                    # An empty search repeats the previous one, as in less
+                    pager.last_search = self.pager_search or pager.last_search
+                    if pager.last_search and not pager.search(pager.last_search):
+                        self.pager_message = "Pattern not found"
+                    self.pager_search = None
+                elif event.key == pygame.K_ESCAPE:
+                    self.pager_search = None
+                elif event.key == pygame.K_BACKSPACE:
+                    self.pager_search = self.pager_search[:-1]
+                elif event.unicode.isprintable():
+                    self.pager_search += event.unicode
+            elif event.key in (pygame.K_q, pygame.K_ESCAPE):
+                self.pager = None
+                return
+            elif event.key in (pygame.K_SPACE, pygame.K_PAGEDOWN):
+                pager.scroll(pager.page_lines)
+            elif event.key in (pygame.K_b, pygame.K_PAGEUP):
+                pager.scroll(-pager.page_lines)
+            elif event.key in (pygame.K_RETURN, pygame.K_DOWN, pygame.K_j):
+                pager.scroll(1)
+            elif event.key in (pygame.K_UP, pygame.K_k):
+                pager.scroll(-1)
+            elif event.key == pygame.K_HOME or event.unicode == "g":
+                pager.top = 0
+            elif event.key == pygame.K_END or event.unicode == "G":
+                pager.scroll_to_end()
+            elif event.unicode == "/":
+                self.pager_search = ""
+            elif event.unicode == "n" and pager.last_search:
+                if not pager.search(pager.last_search):
+                    self.pager_message = "Pattern not found"
+
+    def command_grep(self, args):
+        pattern = " ".join(args)
+        try:
+            re.compile(pattern)
+        except re.error as e:
+            self.add_output(f"ERROR: Invalid pattern: {e}")
             assets.play_sound("terminal_error")
+            return
+        self.stream_output(self.grep_results(self.file_index.search(pattern)))
+
+    def grep_results(self, matches):
+        count, files = 0, set()
+        for name, line_no, line, match in matches:
+            count += 1
+            files.add(name)
+            # Lore lines are whole paragraphs, so only show the text around the match
+            start = max(0, match.start() - 40) if match else 0
+            snippet = line[start:start + 100]
+            if start > 0:
+                snippet = "..." + snippet
+            if start + 100 < len(line):
+                snippet += "..."
+            yield f"{name}:{line_no + 1}: {snippet}"
+        if count:
+            yield f"-- {count} matching line(s) in {len(files)} fragment(s) --"
+        else:
+            yield "No matches found."
+
+    def command_find(self, args):
+        term = " ".join(args)
+        names = [name for name in self.files if term in name.lower()]
+        try:
+            content_hits = {name for name, _, _, _ in self.file_index.search(term)}
+        except re.error:
+            content_hits = set()
+        names += sorted(content_hits.difference(names))
+        if not names:
+            self.add_output("No data fragments found.")
+            return
+        self.stream_output(names)
+
+    def command_exit(self, args):
+        self.transition_state = "out"
 
     def finish_typewriter(self):
         self.output_lines.extend(self.typewriter_effect["lines"])
@@ -2342,45 +4081,75 @@ class TerminalState(BaseState):
         self.cursor_visible = self.cursor_timer < FPS // 2
         if self.typewriter_effect["lines"]:
             effect = self.typewriter_effect
-            if (time.time() - effect["start_time"]) * 10 > len(self.output_lines) - (
-                    len(effect["lines"])
-            ):
-                if effect["lines"]:
-                    self.output_lines.append(effect["lines"].pop(0))
+            # Reveal ten lines per second, counted from when this output started
+            if (time.time() - effect["start_time"]) * 10 > effect["pos"]:
+                self.output_lines.append(effect["lines"].pop(0))
+                effect["pos"] += 1
+        elif self.pager is not None:
+            # Wrap the rest of the file in the background within a small per-frame budget
+            self.pager.wrap_for(0.004)
+        elif self.output_stream is not None:
+            for _ in range(self.stream_lines_per_frame):
+                line = next(self.output_stream, None)
+                if line is None:
+                    self.output_stream = None
+                    break
+                self.add_output(line, instant=True)
 
     def render_text_glow(self, text, color, pos, surface):
-        text_surf = TERMINAL_FONT.render(text, True, color)
-        blur_surf = TERMINAL_FONT.render(text, True, tuple(c * 0.5 for c in color))
-        blur_surf.set_alpha(100)
-        surface.blit(blur_surf, (pos[0] + 1, pos[1] + 1))
-        surface.blit(blur_surf, (pos[0] - 1, pos[1] - 1))
-        surface.blit(text_surf, pos)
+        surface.blit(self.glow_cache.get(text, color), (pos[0] - 1, pos[1] - 1))
+
+    def draw_prompt(self, prompt_text, pos, surface):
+        # The input line changes on every keystroke, so it is kept out of the line cache
+        if prompt_text != self.prompt_text:
+            self.prompt_text = prompt_text
+            self.prompt_surface = self.glow_cache.render(prompt_text, GREEN)
+            self.prompt_width = TERMINAL_FONT.size(prompt_text)[0]
+        surface.blit(self.prompt_surface, (pos[0] - 1, pos[1] - 1))
+        return self.prompt_width
 
     def draw(self, surface):
-        surface.fill(BLACK)
-        for y in range(0, SCREEN_HEIGHT, 4):
-            pygame.draw.line(surface, DARK_GREEN, (0, y), (SCREEN_WIDTH, y))
-        y_pos, max_lines = 20, (SCREEN_HEIGHT - 60) // (TERMINAL_FONT.get_height() + 5)
-        start_index = max(0, len(self.output_lines) - max_lines)
-        for line_text in self.output_lines[start_index:]:
+        surface.blit(
+            overlays.scanlines(surface.get_size(), DARK_GREEN, background=BLACK), (0, 0)
+        )
+        if self.pager is not None:
+            self.draw_pager(surface)
+        else:
+            self.draw_scrollback(surface)
+        if self.transition_alpha > 0:
+            self.fade_surface.set_alpha(self.transition_alpha)
+            surface.blit(self.fade_surface, (0, 0))
+
+    def draw_pager(self, surface):
+        y_pos = 20
+        for line_text in self.pager.page():
+            self.render_text_glow(line_text, GREEN, (20, y_pos), surface)
+            y_pos += self.line_height
+        if self.pager_search is not None:
+            status = f"/{self.pager_search}"
+        else:
+            status = self.pager_message or self.pager.status()
+        self.render_text_glow(
+            status, AMBER, (20, 20 + self.pager.page_lines * self.line_height), surface
+        )
+
+    def draw_scrollback(self, surface):
+        y_pos = 20
+        start_index = max(0, len(self.output_lines) - self.visible_lines - self.scroll_offset)
+        for line_text in self.output_lines.window(start_index, self.visible_lines):
             self.render_text_glow(line_text, GREEN, (20, y_pos), surface)
-            y_pos += TERMINAL_FONT.get_height() + 5
-        if not self.typewriter_effect["lines"]:
+            y_pos += self.line_height
+        if not self.typewriter_effect["lines"] and self.output_stream is None:
 
             prompt_text = f"{self.current_prompt}{self.input_text}"
-            self.render_text_glow(prompt_text, GREEN, (20, y_pos), surface)
+            prompt_width = self.draw_prompt(prompt_text, (20, y_pos), surface)
             if self.cursor_visible:
-                cursor_x = 20 + TERMINAL_FONT.size(prompt_text)[0]
+                cursor_x = 20 + prompt_width
                 pygame.draw.rect(
                     surface,
                     GREEN,
                     pygame.Rect(cursor_x + 2, y_pos, 10, TERMINAL_FONT.get_height()),
                 )
-        if self.transition_alpha > 0:
-            fade_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            fade_surf.fill(BLACK)
-            fade_surf.set_alpha(self.transition_alpha)
-            surface.blit(fade_surf, (0, 0))
 
 
 class MenuState(BaseState):
@@ -2412,12 +4181,7 @@ class MenuState(BaseState):
             )
             self.buttons[text] = rect
             y_pos += 70
-        raw_bg = assets.get_image("background")
-        self.background_image = (
-            pygame.transform.scale(raw_bg, (SCREEN_WIDTH, SCREEN_HEIGHT))
-            if raw_bg
-            else None
-        )
+        self.background_image = assets.get_image("background", (SCREEN_WIDTH, SCREEN_HEIGHT))
 
     def on_enter(self):
         self.fade_alpha = 255
@@ -2425,9 +4189,7 @@ class MenuState(BaseState):
         assets.play_sound("menu_music", channel="music", loops=-1, fade_ms=1000)
 
     def on_exit(self):
-        music = assets.get_sound("menu_music")
-        if music:
-            music.fadeout(500)
+        assets.fadeout_music("menu_music", 500)
 
     def handle_events(self, events):
         for event in events:
@@ -2622,16 +4384,7 @@ class SettingsState(BaseState):
         }
         self.dragging_slider = None
 
-        self.rain_particles = []
-        if settings.get("enable_digital_rain"):
-            self.rain_particles = [
-                RainParticle(
-                    random.randint(0, SCREEN_WIDTH),
-                    random.randint(0, SCREEN_HEIGHT),
-                    TERMINAL_FONT,
-                )
-                for _ in range(150)
-            ]
+        self.digital_rain = DigitalRain(150, TERMINAL_FONT, y_range=(0, SCREEN_HEIGHT))
 
     def handle_events(self, events):
         for event in events:
@@ -2740,10 +4493,9 @@ class SettingsState(BaseState):
         surface.fill(BLACK)
         mouse_pos = pygame.mouse.get_pos()
 
-        if self.rain_particles:
-            for p in self.rain_particles:
-                p.update()
-                p.draw(surface)
+        if settings.get("enable_digital_rain"):
+            self.digital_rain.update()
+            self.digital_rain.draw(surface)
 
         surface.blit(self.title_text, self.title_rect)
 
@@ -3386,11 +5138,122 @@ level_5_data = {
 }
 
 
+def collect_image_variants(levels):
+    """Every (image_key, size) the levels and menus scale an image to."""
+    screen_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    variants = {("vignette", screen_size), ("background", screen_size)}
+    for level_data in levels:
+        for obj_data in level_data["objects"]:
+            size = (obj_data["w"], obj_data["h"])
+            for key in ("image_key", "image_locked_key", "image_unlocked_key"):
+                if key in obj_data:
+                    variants.add((obj_data[key], size))
+    return sorted(variants)
+
+
+def build_asset_pack(manifest, variants, path=ASSET_PACK_PATH, index_path=ASSET_PACK_INDEX):
+    """Transcode the manifest into one pack plus a JSON index keyed by content hash.
+
+    Blobs whose hash is already in the previous pack are copied across instead of
+    being decoded again, so a rebuild only pays for the assets that changed.
+    """
+    mixer_format = list(pygame.mixer.get_init() or ())
+    old_blobs, old_data = {}, None
+    try:
+        with open(index_path, "r") as f:
+            old_index = json.load(f)
+        if old_index.get("version") == ASSET_PACK_VERSION:
+            with open(path, "rb") as f:
+                old_data = f.read()
+            old_blobs = old_index["blobs"]
+    except (OSError, ValueError):
+        pass
+
+    # Images the game only ever draws scaled are packed at those sizes alone
+    scaled = {name for name, _ in variants}
+    jobs = []
+    for name, (kind, source) in manifest.items():
+        if kind == "image" and name not in scaled:
+            jobs.append((name, kind, source, None))
+        elif kind == "sound" and mixer_format:
+            jobs.append((name, kind, source, mixer_format))
+    for name, size in variants:
+        if manifest.get(name, (None,))[0] == "image":
+            jobs.append((image_variant_name(name, size), "image", manifest[name][1], size))
+
+    entries, blobs = {}, {}
+    built = reused = 0
+    tmp_path = path + ".tmp"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(tmp_path, "wb") as pack:
+        for name, kind, source, variant in jobs:
+            try:
+                with open(source, "rb") as f:
+                    content = f.read()
+                stamp = source_stamp(source)
+            except OSError as e:
+                print(f"Warning: Could not read {kind} '{source}': {e}")
+                continue
+            digest = hashlib.sha1(content)
+            source_hash = digest.hexdigest()
+            digest.update(repr((kind, variant)).encode())
+            content_hash = digest.hexdigest()
+
+            if content_hash in old_blobs and content_hash not in blobs:
+                offset, length, *extra = old_blobs[content_hash]
+                blobs[content_hash] = [pack.tell(), length] + extra
+                pack.write(old_data[offset:offset + length])
+                reused += 1
+            elif content_hash not in blobs:
+                try:
+                    if kind == "image":
+                        image = pygame.image.load(source)
+                        if variant:
+                            image = pygame.transform.scale(image, variant)
+                        data, extra = pygame.image.tobytes(image, "RGBA"), list(image.get_size())
+                    else:
+                        data, extra = pygame.mixer.Sound(source).get_raw(), []
+                except pygame.error as e:
+                    print(f"Warning: Could not transcode {kind} '{source}': {e}")
+                    continue
+                blobs[content_hash] = [pack.tell(), len(data)] + extra
+                pack.write(data)
+                built += 1
+            entries[name] = {
+                "kind": kind,
+                "source": source,
+                "stamp": list(stamp),
+                "source_hash": source_hash,
+                "hash": content_hash,
+            }
+
+    index = {"version": ASSET_PACK_VERSION, "mixer": mixer_format, "blobs": blobs, "entries": entries}
+    with open(index_path + ".tmp", "w") as f:
+        json.dump(index, f, indent=1)
+    os.replace(tmp_path, path)
+    os.replace(index_path + ".tmp", index_path)
+    print(f"Asset pack: {built} transcoded, {reused} reused, {len(entries)} entries.")
+
+
 def main():
-    global assets, settings, voice_manager
+    global assets, settings, voice_manager, overlays
+    levels = [level_1_data, level_2_data, level_3_data, level_4_data, level_5_data]
+    if "--build-assets" in sys.argv:
+        build_asset_pack(AssetManager().manifest, collect_image_variants(levels))
+        pygame.quit()
+        return
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     settings = SettingsManager()
-    assets = AssetManager()
+    overlays = OverlayBank(
+        settings.get("overlay_budget_mb") * 1024 * 1024,
+        settings.get("static_noise_frames"),
+    )
+    assets = AssetManager(
+        settings.get("scaled_image_budget_mb") * 1024 * 1024,
+        settings.get("image_rleaccel"),
+    )
+    assets.register_image_variants(collect_image_variants(levels))
+    assets.start_preload()
     voice_manager = VoiceManager()
 
     pygame.display.set_caption("Mindfall")
@@ -3425,6 +5288,7 @@ def main():
 
         game_state_manager.handle_events(events)
         game_state_manager.update()
+        assets.update()
         game_state_manager.draw(screen)
 
         pygame.display.flip()
@@ -0,0 +1,15 @@
+import os
+import sys
+import types
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def _no_tts():
+    raise RuntimeError("pyttsx3 is not available")
+
+
+# main imports pyttsx3 at module level; VoiceManager already handles init failing
+sys.modules.setdefault("pyttsx3", types.SimpleNamespace(init=_no_tts))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -0,0 +1,41 @@
+import os
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+import main  # noqa: E402
+
+
+def write_image(path, color):
+    surf = pygame.Surface((8, 8), pygame.SRCALPHA)
+    surf.fill(color)
+    pygame.image.save(surf, str(path))
+
+
+@pytest.fixture
+def pack(tmp_path):
+    source = tmp_path / "sprite.png"
+    write_image(source, (200, 40, 40, 255))
+    paths = str(tmp_path / "assets.pack"), str(tmp_path / "assets.index.json")
+    main.build_asset_pack({"sprite": ("image", str(source))}, [("sprite", (4, 4))], *paths)
+    return source, paths
+
+
+def test_touched_source_still_uses_the_pack(pack):
+    source, paths = pack
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    image = main.AssetPack(*paths).load_image("sprite@4x4", str(source))
+    assert image is not None
+    assert image.get_at((0, 0)) == (200, 40, 40, 255)
+
+
+def test_changed_source_is_skipped_with_a_warning(pack, capsys):
+    source, paths = pack
+    write_image(source, (40, 200, 40, 255))
+
+    asset_pack = main.AssetPack(*paths)
+    assert asset_pack.load_image("sprite@4x4", str(source)) is None
+    assert "rebuild it with --build-assets" in capsys.readouterr().out
@@ -0,0 +1,36 @@
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+import main  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def display():
+    pygame.display.set_mode((1, 1))
+
+
+def two_level_sprite():
+    sprite = pygame.Surface((20, 20), pygame.SRCALPHA)
+    sprite.fill((200, 120, 40, 255), (0, 0, 10, 20))
+    return sprite
+
+
+def test_colorkeyed_sprite_reflection_stays_clear():
+    sprite = main.convert_for_blit(two_level_sprite(), rle=True)
+    assert sprite.get_colorkey() is not None
+
+    cache = main.ReflectionCache(wave_amplitude=0)
+    frame = cache.get_frame(sprite, 0)
+
+    assert frame.get_at((15, 10)).a == 0
+    assert frame.get_at((5, 10)).a == 255
+
+
+def test_colorkeyed_reflection_matches_alpha_sprite():
+    cache = main.ReflectionCache(wave_amplitude=0)
+    keyed = cache.get_frame(main.convert_for_blit(two_level_sprite()), 0)
+    plain = cache.get_frame(two_level_sprite().convert_alpha(), 0)
+
+    for point in ((5, 10), (15, 10)):
+        assert keyed.get_at(point) == plain.get_at(point)
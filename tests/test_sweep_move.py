@@ -0,0 +1,52 @@
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from main import SpatialHash, Wall, sweep_move  # noqa: E402
+
+
+def phase_through(entity):
+    return isinstance(entity, Wall) and entity.phasable
+
+
+def world(*walls):
+    collidables = SpatialHash()
+    for wall in walls:
+        collidables.insert(wall, wall.rect)
+    return collidables
+
+
+@pytest.mark.parametrize("dx", [1000, -1000])
+def test_fast_mover_stops_flush_against_thin_wall(dx):
+    wall = Wall(500, 0, 10, 200, phasable=False)
+    start = 100 if dx > 0 else 800
+    mover = pygame.Rect(start, 50, 20, 20)
+
+    hit_x, hit_y = sweep_move(mover, dx, 0, world(wall))
+
+    assert hit_x is wall and hit_y is None
+    if dx > 0:
+        assert mover.right == wall.rect.left
+    else:
+        assert mover.left == wall.rect.right
+
+
+def test_mover_inside_wall_can_walk_out():
+    wall = Wall(500, 0, 10, 200, phasable=False)
+    mover = pygame.Rect(495, 50, 20, 20)
+
+    hit_x, _ = sweep_move(mover, 1000, 0, world(wall))
+
+    assert hit_x is None
+    assert mover.x == 1495
+
+
+def test_phasable_wall_is_skipped():
+    phasable = Wall(500, 0, 10, 200, phasable=True)
+    solid = Wall(900, 0, 10, 200, phasable=False)
+    mover = pygame.Rect(100, 50, 20, 20)
+
+    hit_x, _ = sweep_move(mover, 1000, 0, world(phasable, solid), skip=phase_through)
+
+    assert hit_x is solid
+    assert mover.right == solid.rect.left
@@ -0,0 +1,45 @@
+import re
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from main import TerminalFileIndex  # noqa: E402
+
+FILES = {
+    "personnel.log": "Dr. Aris Thorne was reassigned.\nAccess was denied to him.\nACCESS DENIED at gate 4.",
+    "audit.log": "The accessed records were purged.\nAccess denied; retry later.",
+}
+
+
+def grep(pattern):
+    index = TerminalFileIndex(FILES)
+    return [(name, line_no) for name, line_no, _, _ in index.search(pattern)]
+
+
+def scan(pattern):
+    regex = re.compile(pattern, re.IGNORECASE)
+    return sorted(
+        (name, line_no)
+        for name, text in FILES.items()
+        for line_no, line in enumerate(text.split("\n"))
+        if regex.search(line)
+    )
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    ["horne", "horne.*", "access denied", "access", "ccess den", "ris thor", "was", "nothing here"],
+)
+def test_indexed_search_matches_a_full_scan(pattern):
+    assert grep(pattern) == scan(pattern)
+
+
+def test_phrase_is_not_matched_word_by_word():
+    assert grep("access denied") == [("audit.log", 1), ("personnel.log", 2)]
+
+
+def test_index_follows_removed_files():
+    index = TerminalFileIndex(FILES)
+    index.remove_file("audit.log")
+    assert [name for name, _, _, _ in index.search("access")] == ["personnel.log", "personnel.log"]
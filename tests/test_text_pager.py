@@ -0,0 +1,26 @@
+import textwrap
+
+import pytest
+
+pytest.importorskip("pygame")
+
+from main import TextPager  # noqa: E402
+
+
+def wrap(paragraph):
+    return textwrap.wrap(paragraph, 20) or [""]
+
+
+def test_search_into_unwrapped_middle_paragraph():
+    paragraphs = ["filler line %d with some padding" % i for i in range(200)]
+    paragraphs[120] = "first half of the paragraph, then the needle, then more text"
+    pager = TextPager("log", "\n".join(paragraphs), wrap, page_lines=10)
+    pager.page()
+
+    assert pager.search("needle")
+    assert pager.pending_search is not None
+    while pager.pending:
+        pager.wrap_for(0.004)
+
+    assert "needle" in pager.lines[pager.top]
+    assert pager.top > pager.paragraph_starts[120]